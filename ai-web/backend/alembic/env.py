@@ -4,18 +4,23 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from logging.config import fileConfig
-from pathlib import Path
 
 from sqlalchemy import create_engine
-from sqlalchemy import pool
 
 from alembic import context
 
-# Add the backend directory to the path so we can import app modules
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+try:
+    from app.database import Base
+except ImportError:
+    # Fall back to adding the backend directory to the path when the app
+    # package is not already importable (PYTHONPATH unset, no editable install).
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from app.database import Base  # noqa: E402
 
-from app.database import Base  # noqa: E402
 from app import models  # noqa: E402, F401  # Import models to register them with Base
 
 # Alembic Config object
@@ -30,6 +35,7 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+@lru_cache(maxsize=1)
 def _get_database_url() -> str:
     """Get database URL from environment or alembic.ini."""
     env_url = os.getenv("DATABASE_URL")
@@ -75,7 +81,7 @@ def run_migrations_online() -> None:
     connection with the context.
     """
     url = _get_database_url()
-    connectable = create_engine(url, poolclass=pool.NullPool)
+    connectable = create_engine(url, pool_pre_ping=True)
 
     with connectable.connect() as connection:
         context.configure(
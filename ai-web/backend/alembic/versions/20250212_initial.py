@@ -11,7 +11,9 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.seed_utils import bulk_seed
 
 
 # revision identifiers, used by Alembic.
@@ -50,7 +52,7 @@ def upgrade() -> None:
         sa.Column("primary_risk", sa.String(length=255), nullable=True),
         sa.Column("include_risks", sa.Boolean(), nullable=False),
         sa.Column("summary", sa.Text(), nullable=False),
-        sa.Column("plan", postgresql.JSONB(), nullable=False),
+        sa.Column("plan", JSONB(), nullable=False),
         sa.Column("created_at", sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
@@ -75,7 +77,12 @@ def upgrade() -> None:
         sa.Column("slug", sa.String(length=120), nullable=False),
         sa.Column("source", sa.String(length=255), nullable=False),
         sa.Column("content", sa.Text(), nullable=False),
-        sa.Column("embedding", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "embedding",
+            JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
         sa.Column("created_at", sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
@@ -112,17 +119,6 @@ def upgrade() -> None:
         },
     ]
 
-    for entry in seed_data:
-        conn.execute(
-            sa.text(
-                """
-                INSERT INTO document_chunks (slug, source, content, embedding, created_at)
-                VALUES (:slug, :source, :content, '[]'::jsonb, now())
-                """
-            ),
-            entry,
-        )
-
     # resources seeds
     resource_seed = [
         {
@@ -145,17 +141,24 @@ def upgrade() -> None:
         },
     ]
 
-    for entry in resource_seed:
-        conn.execute(
-            sa.text(
-                """
-                INSERT INTO resources (title, description, url, difficulty, created_at, updated_at)
-                VALUES (:title, :description, :url, :difficulty, now(), now())
-                """
-            ),
-            entry,
-        )
-
+    # Seed inside the migration transaction so a failed load never leaves the
+    # schema applied without its alembic_version stamp. These columns have no
+    # server defaults yet, so the timestamps come from Postgres' now().
+    bulk_seed(
+        conn,
+        "document_chunks",
+        ("slug", "source", "content", "created_at"),
+        [{**entry, "created_at": sa.func.now()} for entry in seed_data],
+    )
+    bulk_seed(
+        conn,
+        "resources",
+        ("title", "description", "url", "difficulty", "created_at", "updated_at"),
+        [
+            {**entry, "created_at": sa.func.now(), "updated_at": sa.func.now()}
+            for entry in resource_seed
+        ],
+    )
 
 def downgrade() -> None:
     op.drop_index(op.f("ix_document_chunks_slug"), table_name="document_chunks")
@@ -0,0 +1,64 @@
+"""Store document chunk embeddings as pgvector vectors with an HNSW index.
+
+Revision ID: 20251208_pgvector_embeddings
+Revises: 3ace5ef187c7
+Create Date: 2025-12-08
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251208_pgvector_embeddings"
+down_revision: Union[str, None] = "3ace5ef187c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBED_DIM = 256
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    # Empty JSONB arrays meant "not embedded yet"; vectors use NULL for that.
+    op.alter_column(
+        "document_chunks",
+        "embedding",
+        existing_type=JSONB(),
+        nullable=True,
+        server_default=None,
+    )
+    op.execute("UPDATE document_chunks SET embedding = NULL WHERE embedding = '[]'::jsonb")
+    op.execute(
+        f"ALTER TABLE document_chunks ALTER COLUMN embedding TYPE vector({EMBED_DIM}) "
+        "USING embedding::text::vector"
+    )
+
+    op.create_index(
+        "ix_document_chunks_embedding_hnsw",
+        "document_chunks",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_embedding_hnsw", table_name="document_chunks")
+    op.execute(
+        "ALTER TABLE document_chunks ALTER COLUMN embedding TYPE jsonb "
+        "USING COALESCE(embedding::text::jsonb, '[]'::jsonb)"
+    )
+    op.alter_column(
+        "document_chunks",
+        "embedding",
+        existing_type=JSONB(),
+        nullable=False,
+        server_default=sa.text("'[]'::jsonb"),
+    )
@@ -0,0 +1,45 @@
+"""Add descending created_at indexes for the history endpoints.
+
+Revision ID: 20251209_history_indexes
+Revises: 20251208_pgvector_embeddings
+Create Date: 2025-12-09
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251209_history_indexes"
+down_revision: Union[str, None] = "20251208_pgvector_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_HISTORY_INDEXES = (
+    ("ix_echo_attempts_created_desc", "echo_attempts"),
+    ("ix_plan_runs_created_desc", "plan_runs"),
+    ("ix_agent_runs_created_desc", "agent_runs"),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table in _HISTORY_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [sa.text("created_at DESC")],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in reversed(_HISTORY_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,56 @@
+"""Store timestamps as timestamptz filled by the database clock.
+
+Revision ID: 20251210_server_timestamps
+Revises: 20251209_history_indexes
+Create Date: 2025-12-10
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251210_server_timestamps"
+down_revision: Union[str, None] = "20251209_history_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS = (
+    ("echo_attempts", "created_at"),
+    ("plan_runs", "created_at"),
+    ("resources", "created_at"),
+    ("resources", "updated_at"),
+    ("document_chunks", "created_at"),
+    ("agent_runs", "created_at"),
+)
+
+
+def upgrade() -> None:
+    # Existing values were written by datetime.utcnow(), so read them as UTC.
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(_TIMESTAMP_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,46 @@
+"""Store document chunk embeddings as half-precision pgvector halfvec.
+
+Revision ID: 20251211_halfvec_embeddings
+Revises: 20251210_server_timestamps
+Create Date: 2025-12-11
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251211_halfvec_embeddings"
+down_revision: Union[str, None] = "20251210_server_timestamps"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBED_DIM = 256
+
+
+def _retype(column_type: str, opclass: str) -> None:
+    # The HNSW index is tied to the column type's operator class, so rebuild it.
+    op.drop_index("ix_document_chunks_embedding_hnsw", table_name="document_chunks")
+    op.execute(
+        f"ALTER TABLE document_chunks ALTER COLUMN embedding TYPE {column_type}({EMBED_DIM}) "
+        f"USING embedding::{column_type}({EMBED_DIM})"
+    )
+    op.create_index(
+        "ix_document_chunks_embedding_hnsw",
+        "document_chunks",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": opclass},
+    )
+
+
+def upgrade() -> None:
+    # halfvec requires pgvector 0.7+.
+    _retype("halfvec", "halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    _retype("vector", "vector_cosine_ops")
@@ -0,0 +1,52 @@
+"""Add the unique index that backs the flaky-echo counter upsert.
+
+Revision ID: 20251212_echo_attempt_upsert
+Revises: 20251211_halfvec_embeddings
+Create Date: 2025-12-12
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251212_echo_attempt_upsert"
+down_revision: Union[str, None] = "20251211_halfvec_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Racing first calls may have created duplicate counter rows; keep the newest.
+    op.execute(
+        """
+        DELETE FROM echo_attempts AS older
+        USING echo_attempts AS newer
+        WHERE older.failures > 0
+          AND older.client_key = newer.client_key
+          AND older.failures = newer.failures
+          AND older.id < newer.id
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_echo_attempts_client_failures",
+            "echo_attempts",
+            ["client_key", "failures"],
+            unique=True,
+            postgresql_where=sa.text("failures > 0"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ux_echo_attempts_client_failures",
+            table_name="echo_attempts",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+"""Add the composite index behind keyset-paginated agent history.
+
+Revision ID: 20251213_agent_history_keyset
+Revises: 20251212_echo_attempt_upsert
+Create Date: 2025-12-13
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251213_agent_history_keyset"
+down_revision: Union[str, None] = "20251212_echo_attempt_upsert"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_agent_runs_slug_created_desc",
+            "agent_runs",
+            ["feature_slug", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_agent_runs_slug_created_desc",
+            table_name="agent_runs",
+            postgresql_concurrently=True,
+        )
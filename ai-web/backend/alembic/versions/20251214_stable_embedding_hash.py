@@ -0,0 +1,30 @@
+"""Clear chunk embeddings computed with the per-process salted hash.
+
+Revision ID: 20251214_stable_embedding_hash
+Revises: 20251213_agent_history_keyset
+Create Date: 2025-12-14
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251214_stable_embedding_hash"
+down_revision: Union[str, None] = "20251213_agent_history_keyset"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # embed_text now buckets tokens with CRC32; NULL vectors are recomputed the
+    # next time the retrieval index is loaded.
+    op.execute("UPDATE document_chunks SET embedding = NULL WHERE embedding IS NOT NULL")
+
+
+def downgrade() -> None:
+    # Vectors from either hash are regenerated on demand, so there is nothing to restore.
+    pass
@@ -0,0 +1,100 @@
+"""Replace the slug index on document chunks with a unique (slug, source) index.
+
+Also seeds the agent feature chunks, relying on the new index for ON CONFLICT.
+
+Revision ID: 20251215_chunk_slug_source_unique
+Revises: 20251214_stable_embedding_hash
+Create Date: 2025-12-15
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.seed_utils import bulk_seed
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20251215_chunk_slug_source_unique"
+down_revision: Union[str, None] = "20251214_stable_embedding_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Re-run seeds may have stored the same chunk twice; keep the newest copy.
+    op.execute(
+        """
+        DELETE FROM document_chunks AS older
+        USING document_chunks AS newer
+        WHERE older.slug = newer.slug
+          AND older.source = newer.source
+          AND older.id < newer.id
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_document_chunks_slug_source",
+            "document_chunks",
+            ["slug", "source"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        # Slug-only filters use the prefix of the composite index.
+        op.drop_index(
+            "ix_document_chunks_slug",
+            table_name="document_chunks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    # Feature-related document chunks for the release readiness agent. Embeddings
+    # stay NULL until the retrieval index loads; created_at uses the server default.
+    seed_data = [
+        {
+            "slug": "release-readiness",
+            "source": "docs/agent",
+            "content": "The release readiness agent evaluates feature launches by analyzing "
+                       "launch windows, stakeholder contacts, and SLO requirements. It provides "
+                       "actionable recommendations for successful product releases.",
+        },
+        {
+            "slug": "curriculum-pathways",
+            "source": "features/curriculum",
+            "content": "Curriculum Pathways helps instructors create sequenced lab recommendations "
+                       "based on student progress and prior completions. It targets intermediate "
+                       "instructors and aims for 90% adoption rate.",
+        },
+        {
+            "slug": "team-analytics",
+            "source": "features/analytics",
+            "content": "Team Analytics Dashboard provides consolidated insights on agent usage "
+                       "and completion trends. Designed for Program Managers with advanced "
+                       "experience levels, targeting 25% increase in daily active users.",
+        },
+    ]
+    bulk_seed(
+        op.get_bind(),
+        "document_chunks",
+        ("slug", "source", "content"),
+        seed_data,
+        conflict_columns=("slug", "source"),
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_document_chunks_slug",
+            "document_chunks",
+            ["slug"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ux_document_chunks_slug_source",
+            table_name="document_chunks",
+            postgresql_concurrently=True,
+        )
@@ -13,21 +13,68 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 
+# Parse the allowed origins once at import; ``Settings`` just binds the tuple.
+_DEFAULT_ORIGINS: tuple[str, ...] = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS", "http://localhost:5173,http://localhost:8080,http://localhost"
+    ).split(",")
+    if origin.strip()
+)
+
 
 class Settings:
     """Runtime configuration loaded from environment variables."""
 
     database_url: str
-    cors_origins: list[str]
+    cors_origins: tuple[str, ...]
     gemini_api_key: str | None
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    pool_timeout: int
+    statement_timeout_ms: int
+    run_create_all: bool
+    threadpool_size: int
+    llm_cache_size: int
+    llm_cache_ttl: float
+    faiss_cache_dir: str | None
+    query_cache_size: int
+    query_cache_ttl: float
 
     def __init__(self) -> None:
         self.database_url = os.getenv(
             "DATABASE_URL", "postgresql+psycopg2://aiweb:aiweb@db:5432/aiweb",
         )
-        origins = os.getenv("CORS_ORIGINS", "http://localhost:5173,http://localhost:8080,http://localhost")
-        self.cors_origins = [origin.strip() for origin in origins.split(",") if origin.strip()]
+        self.cors_origins = _DEFAULT_ORIGINS
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
+        # Connection pool tuning so concurrent sync endpoints do not queue on
+        # SQLAlchemy's default five-connection pool.
+        self.pool_size = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+        self.pool_pre_ping = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+        self.pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        # Server-side cap so a runaway query cannot pin a pooled connection;
+        # 0 disables it. Alembic uses its own engine and is not affected.
+        self.statement_timeout_ms = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+        # Alembic owns the schema; only opt into ``create_all`` for throwaway
+        # local databases that skip migrations.
+        self.run_create_all = os.getenv("RUN_CREATE_ALL", "0") == "1"
+        # Sync endpoints run on AnyIO's worker threads (40 by default); size the
+        # limiter so it is not the bottleneck ahead of the connection pool.
+        self.threadpool_size = int(os.getenv("THREADPOOL_SIZE", "100"))
+        # Reuse Gemini answers for identical prompts; set LLM_CACHE_SIZE=0 to disable.
+        self.llm_cache_size = int(os.getenv("LLM_CACHE_SIZE", "256"))
+        self.llm_cache_ttl = float(os.getenv("LLM_CACHE_TTL", "3600"))
+        # Built FAISS indexes are written here so restarts can skip the rebuild;
+        # set FAISS_CACHE_DIR to an empty string to keep them in memory only.
+        self.faiss_cache_dir = os.getenv("FAISS_CACHE_DIR", "/tmp/faiss_cache") or None
+        # Remember FAISS search results for repeated queries against the same
+        # index; set QUERY_CACHE_SIZE=0 to disable.
+        self.query_cache_size = int(os.getenv("QUERY_CACHE_SIZE", "1000"))
+        self.query_cache_ttl = float(os.getenv("QUERY_CACHE_TTL", "300"))
 
 
 @lru_cache(maxsize=1)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Iterator
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
@@ -15,9 +16,33 @@ class Base(DeclarativeBase):
     """Declarative base so models share metadata."""
 
 
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson, which also handles dataclasses."""
+
+    return orjson.dumps(value).decode("utf-8")
+
+
 settings = get_settings()
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.pool_size,
+    max_overflow=settings.max_overflow,
+    pool_recycle=settings.pool_recycle,
+    pool_pre_ping=settings.pool_pre_ping,
+    pool_timeout=settings.pool_timeout,
+    # Batch executemany INSERTs into multi-VALUES statements and UPDATEs via
+    # execute_batch so bulk writes cost one round-trip per page, not per row.
+    executemany_mode="values_plus_batch",
+    json_serializer=_json_serializer,
+    connect_args=(
+        {"options": f"-c statement_timeout={settings.statement_timeout_ms}"}
+        if settings.statement_timeout_ms > 0
+        else {}
+    ),
+)
+# INSERT ... RETURNING already hands back generated keys, so skip the reload
+# SELECT that expire-on-commit would otherwise issue on the next attribute read.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db() -> Iterator[Session]:
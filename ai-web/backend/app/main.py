@@ -1,26 +1,51 @@
 """FastAPI application entry point used by the lab backend container."""
 
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import anyio.to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from app.config import get_settings
-from app.database import Base, engine
-from app.routers.agent import router as agent_router
-from app.routers.chat import router as chat_router
-from app.routers.echo import router as echo_router
-from app.routers.gemini import router as gemini_router
-from app.routers.planner import router as planner_router
-from app.routers.resources import router as resources_router
+from app.database import Base, engine, session_scope
+from app.routers import agent, chat, echo, gemini, planner, resources
+from app.services.rag import get_cached_index
 
 # Load environment variables from a local .env file when present so the
 # application picks up credentials configured for the labs.
 load_dotenv()
 
 settings = get_settings()
-Base.metadata.create_all(bind=engine)
+if settings.run_create_all:
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    Base.metadata.create_all(bind=engine)
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the sync worker pool and warm the chat retrieval index once per worker."""
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    try:
+        # Requests re-check the corpus via get_cached_index; this only saves the
+        # first chat from paying for the build.
+        with session_scope() as db:
+            get_cached_index(db)
+    except Exception:  # Requests retry the build or fall back to pgvector search.
+        logger.exception("Failed to build the chat retrieval index")
+    yield
+
 
-app = FastAPI()
+# orjson encodes straight to bytes, which keeps hot probes like /health cheap.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -28,12 +53,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(agent_router)
-app.include_router(chat_router)
-app.include_router(echo_router)
-app.include_router(gemini_router)
-app.include_router(planner_router)
-app.include_router(resources_router)
+_ROUTER_MODULES = (agent, chat, echo, gemini, planner, resources)
+for module in _ROUTER_MODULES:
+    app.include_router(module.router)
 
 
 @app.get("/health")
@@ -5,17 +5,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
-
-def utcnow() -> datetime:
-    """Return a timezone-naive UTC timestamp for created_at columns."""
-
-    return datetime.utcnow()
+# Dimension of the hashed bag-of-words embeddings produced by ``app.services.rag``.
+EMBED_DIM = 256
 
 
 class EchoAttempt(Base):
@@ -28,7 +26,22 @@ class EchoAttempt(Base):
     failures: Mapped[int] = mapped_column(Integer, default=1)
     attempts: Mapped[int] = mapped_column(Integer, default=0)
     message: Mapped[str] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    # Timestamps come from Postgres ``now()``, never a Python clock value.
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+# History endpoints read ``ORDER BY created_at DESC LIMIT n``; a descending index
+# lets Postgres walk the newest rows instead of sorting the table.
+Index("ix_echo_attempts_created_desc", EchoAttempt.created_at.desc())
+# ``/flaky-echo`` keeps one counter row per client key and upserts into it;
+# plain ``/echo`` rows (failures=0) are an append-only log outside the index.
+Index(
+    "ux_echo_attempts_client_failures",
+    EchoAttempt.client_key,
+    EchoAttempt.failures,
+    unique=True,
+    postgresql_where=EchoAttempt.failures > 0,
+)
 
 
 class PlanRun(Base):
@@ -44,7 +57,10 @@ class PlanRun(Base):
     include_risks: Mapped[bool] = mapped_column(Boolean, default=True)
     summary: Mapped[str] = mapped_column(Text)
     plan: Mapped[Any] = mapped_column(JSONB)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+Index("ix_plan_runs_created_desc", PlanRun.created_at.desc())
 
 
 class Resource(Base):
@@ -57,21 +73,34 @@ class Resource(Base):
     description: Mapped[str] = mapped_column(Text)
     url: Mapped[str] = mapped_column(String(500))
     difficulty: Mapped[str] = mapped_column(String(30), default="intermediate")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
 
 
 class DocumentChunk(Base):
     """Indexed content used by the retrieval-augmented chatbot."""
 
     __tablename__ = "document_chunks"
+    __table_args__ = (
+        Index("ux_document_chunks_slug_source", "slug", "source", unique=True),
+        Index(
+            "ix_document_chunks_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    slug: Mapped[str] = mapped_column(String(120), index=True)
+    slug: Mapped[str] = mapped_column(String(120))
     source: Mapped[str] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text)
-    embedding: Mapped[list[float]] = mapped_column(JSONB)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    # Half-precision storage: 2 bytes per dimension, ample for unit-norm hashed
+    # embeddings, and the HNSW index pages shrink by the same factor.
+    embedding: Mapped[list[float] | None] = mapped_column(HALFVEC(EMBED_DIM), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
 class AgentRun(Base):
@@ -89,5 +118,9 @@ class AgentRun(Base):
     tool_calls: Mapped[Any] = mapped_column(JSONB)
     rag_contexts: Mapped[Any] = mapped_column(JSONB, default=list)
     used_gemini: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
 
+Index("ix_agent_runs_created_desc", AgentRun.created_at.desc())
+# Serves the per-feature history page as an index seek, newest first.
+Index("ix_agent_runs_slug_created_desc", AgentRun.feature_slug, AgentRun.created_at.desc(), AgentRun.id.desc())
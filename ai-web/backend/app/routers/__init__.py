@@ -3,4 +3,9 @@
 Routers group related endpoints together so the FastAPI entry point in
 ``app/main.py`` can stay focused on application setup. See ``echo`` and
 ``gemini`` for concrete examples used throughout the AI in Web curriculum.
+
+Handlers that take a SQLAlchemy ``Session`` must stay plain ``def`` functions.
+FastAPI runs those on its worker threadpool; declaring them ``async def`` would
+run the blocking database calls on the event loop and stall every request.
+``tests/test_sync_handlers.py`` enforces this.
 """
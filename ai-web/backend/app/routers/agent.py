@@ -9,19 +9,27 @@ This router demonstrates a production-grade agent API with:
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Iterator
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.routers.caching import conditional_json, etag_for
+from app.routers.streaming import event_stream, sse_event
 from app.services.agent import (
     AgentRunContext,
     AgentRunResult,
     AgentServiceError,
     get_agent_history,
+    get_agent_run_detail,
     run_release_readiness_agent,
+    stream_release_readiness_agent,
 )
 
 router = APIRouter(prefix="/ai", tags=["ai"])
@@ -39,6 +47,15 @@ class AgentHistoryItem(BaseModel):
     created_at: str
 
 
+class AgentHistoryDetail(AgentHistoryItem):
+    """Full record of one historical agent run."""
+
+    audience_experience: str
+    recommended_actions: list[dict[str, Any]]
+    tool_calls: list[dict[str, Any]]
+    rag_contexts: list[dict[str, Any]]
+
+
 class AgentHistoryResponse(BaseModel):
     """Response containing historical agent runs."""
 
@@ -69,10 +86,46 @@ def release_readiness(
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+def _agent_events(first: AgentRunResult, rest: Iterator[AgentRunResult]) -> Iterator[bytes]:
+    # Hold one frame back so the last one can be flagged ``done``.
+    previous = first
+    for frame in rest:
+        yield sse_event({"done": False, "result": previous.model_dump(mode="json")})
+        previous = frame
+    yield sse_event({"done": True, "result": previous.model_dump(mode="json")})
+
+
+@router.post("/release-readiness/stream")
+def release_readiness_stream(
+    payload: AgentRunContext,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Stream the agent result as server-sent events while Gemini responds.
+
+    Each frame carries a full ``AgentRunResult`` snapshot: the first holds the
+    deterministic tool output, later ones add the Gemini insight and AI
+    recommendations, and the frame marked ``done`` is the persisted result.
+    """
+
+    frames = stream_release_readiness_agent(payload, db=db)
+    try:
+        # Unknown features fail before the first frame; surface them as a 404.
+        first = next(frames)
+    except AgentServiceError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return event_stream(_agent_events(first, frames))
+
+
 @router.get("/history", response_model=AgentHistoryResponse)
 def agent_history(
     feature_slug: str | None = Query(None, description="Filter by feature slug"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of runs to return"),
+    before: datetime | None = Query(
+        None, description="Only return runs created before this timestamp (the last run's created_at)"
+    ),
+    before_id: int | None = Query(
+        None, description="The last run's id; pair with before so runs sharing a timestamp are not skipped"
+    ),
     db: Session = Depends(get_db),
 ) -> AgentHistoryResponse:
     """Retrieve historical agent runs from the database.
@@ -83,7 +136,9 @@ def agent_history(
     - Analyzing patterns in release readiness assessments
     """
 
-    runs = get_agent_history(db, feature_slug=feature_slug, limit=limit)
+    if before_id is not None and before is None:
+        raise HTTPException(status_code=400, detail="before_id requires before.")
+    runs = get_agent_history(db, feature_slug=feature_slug, limit=limit, before=before, before_id=before_id)
     items = [
         AgentHistoryItem(
             id=run.id,
@@ -99,13 +154,32 @@ def agent_history(
     return AgentHistoryResponse(runs=items, total=len(items))
 
 
-@router.get("/features")
-def list_available_features() -> dict[str, Any]:
-    """List available features that the agent can analyze.
+@router.get("/history/{run_id}", response_model=AgentHistoryDetail)
+def agent_history_detail(run_id: int, db: Session = Depends(get_db)) -> AgentHistoryDetail:
+    """Return one stored agent run with its recommendations, tool calls, and contexts."""
+
+    run = get_agent_run_detail(db, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Agent run {run_id} not found.")
+    return AgentHistoryDetail(
+        id=run.id,
+        feature_slug=run.feature_slug,
+        audience_role=run.audience_role,
+        audience_experience=run.audience_experience,
+        summary=run.summary,
+        gemini_insight=run.gemini_insight,
+        used_gemini=run.used_gemini,
+        created_at=run.created_at.isoformat(),
+        recommended_actions=run.recommended_actions or [],
+        tool_calls=run.tool_calls or [],
+        rag_contexts=run.rag_contexts or [],
+    )
+
+
+@lru_cache(maxsize=1)
+def _features_payload() -> tuple[bytes, str]:
+    """Encode the feature catalog and its ETag once; it is built from static module data."""
 
-    This endpoint helps the frontend populate dropdowns and
-    provides metadata about supported features.
-    """
     from app.services.agent_tools import _FEATURE_BRIEFS, _LAUNCH_WINDOWS
 
     features = []
@@ -120,4 +194,18 @@ def list_available_features() -> dict[str, Any]:
             "launch_date": window.window_start.isoformat() if window else None,
         })
 
-    return {"features": features, "total": len(features)}
+    payload = orjson.dumps({"features": features, "total": len(features)})
+    return payload, etag_for(payload)
+
+
+@router.get("/features")
+def list_available_features(request: Request) -> Response:
+    """List available features that the agent can analyze.
+
+    This endpoint helps the frontend populate dropdowns and
+    provides metadata about supported features. Repeat callers that send
+    ``If-None-Match`` receive an empty ``304``.
+    """
+
+    payload, etag = _features_payload()
+    return conditional_json(request, payload, etag=etag, cache_control="private, max-age=30")
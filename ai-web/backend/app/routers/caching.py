@@ -0,0 +1,34 @@
+"""Conditional GET helpers for endpoints that serve slowly changing catalogs."""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def etag_for(payload: bytes) -> str:
+    """Return a strong ETag derived from the encoded response body."""
+
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def conditional_json(
+    request: Request,
+    payload: bytes,
+    *,
+    etag: str | None = None,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """Return ``payload`` as JSON, or an empty 304 when the client's copy matches.
+
+    Pass a precomputed ``etag`` when the payload is static so the hash is not
+    recomputed on every request.
+    """
+
+    etag = etag or etag_for(payload)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import logging
+from typing import Iterator
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.services.chatbot import ChatResult, run_chat
+from app.routers.streaming import event_stream, sse_event
+from app.services.chatbot import (
+    ChatResult,
+    ChatStreamInterrupted,
+    ChatTurn,
+    prepare_chat,
+    run_chat,
+    stream_chat_answer,
+)
+from app.services.rag import ChunkIndex, get_cached_index
 
 router = APIRouter(prefix="/chat", tags=["chat"])
+logger = logging.getLogger(__name__)
 
 
 class ChatMessage(BaseModel):
@@ -23,11 +37,30 @@ class ChatResponse(BaseModel):
     used_gemini: bool
 
 
+def get_chunk_index(db: Session = Depends(get_db)) -> ChunkIndex | None:
+    """Return the process-wide FAISS index, rebuilt when the chunk corpus changes.
+
+    The check is one aggregate query, so chunks ingested or re-embedded after
+    startup are searchable without a restart. ``None`` falls back to pgvector.
+    """
+
+    try:
+        return get_cached_index(db)
+    except Exception:
+        logger.exception("Failed to load the chat retrieval index")
+        db.rollback()
+        return None
+
+
 @router.post("/", response_model=ChatResponse)
-def chat(payload: ChatMessage, db: Session = Depends(get_db)) -> ChatResponse:
+def chat(
+    payload: ChatMessage,
+    db: Session = Depends(get_db),
+    index: ChunkIndex | None = Depends(get_chunk_index),
+) -> ChatResponse:
     """Return a chatbot response enriched with retrieved context."""
 
-    result: ChatResult = run_chat(payload.message, db)
+    result: ChatResult = run_chat(payload.message, db, index=index)
     return ChatResponse(
         answer=result.answer,
         contexts=[{"content": ctx.content, "source": ctx.source, "score": ctx.score} for ctx in result.contexts],
@@ -35,3 +68,40 @@ def chat(payload: ChatMessage, db: Session = Depends(get_db)) -> ChatResponse:
         used_gemini=result.used_gemini,
     )
 
+
+def _chat_events(turn: ChatTurn) -> Iterator[bytes]:
+    used_gemini = False
+    try:
+        for delta, from_gemini in stream_chat_answer(turn):
+            used_gemini = used_gemini or from_gemini
+            yield sse_event({"delta": delta})
+    except ChatStreamInterrupted as exc:
+        # Keep the partial answer as-is and report the failure in its own frame.
+        yield sse_event({"error": str(exc)})
+    yield sse_event(
+        {
+            "done": True,
+            "contexts": [{"content": ctx.content, "source": ctx.source, "score": ctx.score} for ctx in turn.contexts],
+            "steps": [{"name": step.name, "detail": step.detail} for step in turn.steps],
+            "used_gemini": used_gemini,
+        }
+    )
+
+
+@router.post("/stream")
+def chat_stream(
+    payload: ChatMessage,
+    db: Session = Depends(get_db),
+    index: ChunkIndex | None = Depends(get_chunk_index),
+) -> StreamingResponse:
+    """Stream the chatbot answer as server-sent events.
+
+    Retrieval runs before the response starts and ends its transaction, so no
+    pooled connection is held while Gemini tokens arrive. Each ``delta`` frame
+    carries answer text; an ``error`` frame reports a Gemini failure after a
+    partial answer; the final ``done`` frame carries contexts, steps, and
+    ``used_gemini``.
+    """
+
+    turn = prepare_chat(payload.message, db, index=index)
+    return event_stream(_chat_events(turn))
@@ -6,7 +6,7 @@ routes in a dedicated module mirrors the folder structure that students build in
 Lab 01, where routers, services, and schemas live in their own packages.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 
 from app.database import get_db
@@ -17,6 +17,8 @@ from sqlalchemy.orm import Session
 
 router = APIRouter(tags=["echo"])
 
+MAX_SIMULATED_FAILURES = 10
+
 
 class EchoIn(BaseModel):
     """Pydantic model describing the request body submitted from the frontend."""
@@ -34,7 +36,12 @@ def echo(payload: EchoIn, request: Request, db: Session = Depends(get_db)) -> di
 
 @router.post("/flaky-echo")
 def flaky_echo(
-    payload: EchoIn, request: Request, failures: int = 1, db: Session = Depends(get_db)
+    payload: EchoIn,
+    request: Request,
+    # Each distinct positive value creates its own counter row, so cap the range to
+    # keep per-client state bounded.
+    failures: int = Query(1, ge=0, le=MAX_SIMULATED_FAILURES),
+    db: Session = Depends(get_db),
 ) -> dict[str, int | str]:
     """Simulate transient failures before eventually returning the echoed message.
 
@@ -54,17 +61,15 @@ def flaky_echo(
 def echo_history(db: Session = Depends(get_db)) -> list[dict[str, str | int]]:
     """Return the most recent echo attempts so the frontend can display persistence."""
 
-    attempts = (
-        db.execute(select(EchoAttempt).order_by(EchoAttempt.created_at.desc()).limit(10))
-        .scalars()
-        .all()
-    )
-    return [
-        {
-            "id": attempt.id,
-            "msg": attempt.message,
-            "failures": attempt.failures,
-            "attempts": attempt.attempts,
-        }
-        for attempt in attempts
-    ]
+    # Project only the rendered columns so rows skip ORM identity-map work.
+    rows = db.execute(
+        select(
+            EchoAttempt.id,
+            EchoAttempt.message.label("msg"),
+            EchoAttempt.failures,
+            EchoAttempt.attempts,
+        )
+        .order_by(EchoAttempt.created_at.desc())
+        .limit(10)
+    ).mappings()
+    return [dict(row) for row in rows]
@@ -37,17 +37,40 @@ def validate_plan(payload: dict[str, Any]) -> PlanValidationResult:
 
 @router.get("/plan/history", response_model=list[dict[str, Any]])
 def list_plans(db: Session = Depends(get_db)) -> list[dict[str, Any]]:
-    """Return recently generated plans to demonstrate persistence."""
-
-    runs = db.execute(select(PlanRun).order_by(PlanRun.created_at.desc()).limit(10)).scalars().all()
-    return [
-        {
-            "id": run.id,
-            "goal": run.goal,
-            "audience_role": run.audience_role,
-            "audience_experience": run.audience_experience,
-            "summary": run.summary,
-            "plan": run.plan,
-        }
-        for run in runs
-    ]
+    """Return recently generated plans to demonstrate persistence.
+
+    The JSONB ``plan`` body is left out of the listing; fetch it per run from
+    ``/plan/history/{run_id}`` when the full structure is needed.
+    """
+
+    rows = db.execute(
+        select(
+            PlanRun.id,
+            PlanRun.goal,
+            PlanRun.audience_role,
+            PlanRun.audience_experience,
+            PlanRun.summary,
+        )
+        .order_by(PlanRun.created_at.desc())
+        .limit(10)
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
+@router.get("/plan/history/{run_id}", response_model=dict[str, Any])
+def get_plan_run(run_id: int, db: Session = Depends(get_db)) -> dict[str, Any]:
+    """Return a single stored plan including its JSONB body."""
+
+    row = db.execute(
+        select(
+            PlanRun.id,
+            PlanRun.goal,
+            PlanRun.audience_role,
+            PlanRun.audience_experience,
+            PlanRun.summary,
+            PlanRun.plan,
+        ).where(PlanRun.id == run_id)
+    ).mappings().one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Plan run {run_id} not found.")
+    return dict(row)
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.routers.caching import conditional_json
 from app.schemas import ResourceCreate, ResourceOut
 from app.services.resources import create_resource, list_resources
 
 router = APIRouter(prefix="/resources", tags=["resources"])
 
+_RESOURCES_ADAPTER = TypeAdapter(list[ResourceOut])
+
 
 @router.get("/", response_model=list[ResourceOut])
-def get_resources(db: Session = Depends(get_db)) -> list[ResourceOut]:
-    """Return all resources stored in the database."""
+def get_resources(request: Request, db: Session = Depends(get_db)) -> Response:
+    """Return all resources stored in the database.
+
+    The rows are validated once by a module-level adapter and dumped straight
+    to JSON bytes, so FastAPI does not re-validate them against
+    ``response_model``. The ETag is a hash of those bytes, so a new resource
+    changes it without any explicit invalidation.
+    """
 
-    return [ResourceOut.model_validate(resource) for resource in list_resources(db)]
+    resources = _RESOURCES_ADAPTER.validate_python(list_resources(db), from_attributes=True)
+    return conditional_json(request, _RESOURCES_ADAPTER.dump_json(resources))
 
 
 @router.post("/", response_model=ResourceOut)
@@ -0,0 +1,23 @@
+"""Server-sent event helpers shared by the streaming endpoints."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+# ``X-Accel-Buffering`` keeps the nginx proxy from holding frames back.
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(payload: Any) -> bytes:
+    """Encode ``payload`` as a single ``data:`` frame."""
+
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def event_stream(frames: Iterable[bytes]) -> StreamingResponse:
+    """Wrap already-encoded SSE frames in a ``text/event-stream`` response."""
+
+    return StreamingResponse(frames, media_type="text/event-stream", headers=dict(_SSE_HEADERS))
@@ -29,7 +29,7 @@ class PlanStep(BaseModel):
     def _trim_criteria(cls, value: list[str]) -> list[str]:
         """Remove empty acceptance criteria entries submitted by the client."""
 
-        return [item.strip() for item in value if item.strip()]
+        return [stripped for item in value if (stripped := item.strip())]
 
 
 
@@ -55,11 +55,9 @@ class Plan(BaseModel):
     def _ensure_unique_titles(self) -> "Plan":
         """Guarantee that step titles stay unique for accessible rendering."""
 
-        seen: set[str] = set()
-        for step in self.steps:
-            if step.title in seen:
-                raise ValueError("Step titles must be unique within a plan.")
-            seen.add(step.title)
+        titles = [step.title for step in self.steps]
+        if len(set(titles)) != len(titles):
+            raise ValueError("Step titles must be unique within a plan.")
         return self
 
 
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Annotated
+
+from pydantic import BaseModel, Field, HttpUrl, StringConstraints
+
+# Stored URLs were parsed as HttpUrl on the way in, so responses only need a
+# pattern check instead of a full re-parse into a Url object for every row.
+ResourceUrl = Annotated[str, StringConstraints(max_length=500, pattern=r"^https?://\S{3,}$")]
 
 
 class ResourceCreate(BaseModel):
@@ -18,6 +24,7 @@ class ResourceOut(ResourceCreate):
     """Response model returned to clients."""
 
     id: int
+    url: ResourceUrl
 
     class Config:
         from_attributes = True
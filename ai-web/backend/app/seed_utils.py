@@ -0,0 +1,36 @@
+"""Bulk seeding helpers shared by the Alembic migrations."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+
+
+def bulk_seed(
+    conn: Connection,
+    table: str,
+    columns: Sequence[str],
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    conflict_columns: Sequence[str] | None = None,
+) -> None:
+    """Insert ``rows`` into ``table`` with one multi-VALUES ``INSERT``.
+
+    Row values may be SQL expressions (``sa.func.now()``) as well as plain
+    parameters. Passing ``conflict_columns`` adds ``ON CONFLICT DO NOTHING``
+    so seeds stay idempotent.
+    """
+
+    if not rows:
+        return
+
+    target = sa.table(table, *(sa.column(name) for name in columns))
+    statement = postgresql.insert(target).values(
+        [{name: row[name] for name in columns} for row in rows]
+    )
+    if conflict_columns is not None:
+        statement = statement.on_conflict_do_nothing(index_elements=list(conflict_columns))
+    conn.execute(statement)
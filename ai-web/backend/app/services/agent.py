@@ -9,11 +9,17 @@ This module demonstrates a production-grade agent architecture that:
 
 from __future__ import annotations
 
+import logging
 import os
-from datetime import date
-from typing import Any, Literal
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Literal
 
 from pydantic import BaseModel, Field
+from sqlalchemy import Row, select, tuple_
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -23,33 +29,45 @@ from app.services.agent_tools import (
     FeatureBrief,
     LaunchWindow,
     SupportContact,
+    feature_preview,
     fetch_feature_brief,
     fetch_launch_window,
     fetch_support_contacts,
+    launch_window_preview,
+    launch_window_range,
     list_slo_watch_items,
 )
+from app.services.gemini import get_model
+from app.services.llm_cache import LLMCache, gemini_cache
 from app.services.planner import build_plan
-from app.services.rag import RetrievedContext, build_retriever
+from app.services.rag import RetrievedContext, get_cached_index
 
 try:
     import google.generativeai as genai
 except ImportError:
     genai = None
 
+logger = logging.getLogger(__name__)
+
 
 class AgentServiceError(RuntimeError):
     """Raised when the agent cannot complete its workflow."""
 
 
-class AgentToolCall(BaseModel):
+# Internal records built on every run are plain dataclasses: they skip
+# per-instance validation, and pydantic still serializes them inside
+# ``AgentRunResult``.
+@dataclass(slots=True, frozen=True)
+class AgentToolCall:
     """Trace of a tool invocation the agent performed."""
 
     tool: str
-    arguments: dict[str, Any]
+    arguments: dict[str, Any] = field(hash=False)
     output_preview: str
 
 
-class AgentRecommendation(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AgentRecommendation:
     """Action item recommended by the agent."""
 
     title: str
@@ -57,7 +75,8 @@ class AgentRecommendation(BaseModel):
     priority: Literal["high", "medium", "low"] = "medium"
 
 
-class RAGContext(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RAGContext:
     """Retrieved context from the FAISS index."""
 
     content: str
@@ -87,24 +106,132 @@ class AgentRunResult(BaseModel):
     used_gemini: bool = False
 
 
-def _generate_gemini_insight(
+# One compiled pattern covers both reply line shapes; case and stray
+# whitespace from the model no longer cause a line to be dropped.
+_INSIGHT_LINE_RE = re.compile(
+    r"""
+    ^\s*(?:
+        INSIGHT:\s*(?P<insight>.*?)
+      | RECOMMENDATION_\w*:\s*(?P<title>[^|]*)\|(?P<detail>[^|]*)\|(?P<priority>[^|]*)(?:\|.*)?
+    )\s*$
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+# The instruction text never changes, so only the context block and the two
+# run-specific values are formatted per call.
+_PROMPT_HEAD = """You are a release readiness advisor helping teams prepare for feature launches.
+Based on the following context, provide:
+1. A brief strategic insight (2-3 sentences) about the launch readiness
+2. Two specific AI-generated recommendations with priority levels
+
+Context:
+"""
+_PROMPT_TAIL = """
+
+User's Launch Date: {launch_date}
+Include Risk Analysis: {include_risks}
+
+Respond in this exact format:
+INSIGHT: <your strategic insight here>
+RECOMMENDATION_1: <title>|<detail>|<priority: high/medium/low>
+RECOMMENDATION_2: <title>|<detail>|<priority: high/medium/low>"""
+
+
+def _parse_insight_line(line: str) -> str | AgentRecommendation | None:
+    """Parse one ``INSIGHT:`` or ``RECOMMENDATION_n:`` line from Gemini's reply."""
+
+    match = _INSIGHT_LINE_RE.match(line)
+    if match is None:
+        return None
+    if match["title"] is None:
+        return match["insight"] or None
+    priority = match["priority"].strip().lower()
+    if priority not in ("high", "medium", "low"):
+        priority = "medium"
+    return AgentRecommendation(
+        title=f"[AI] {match['title'].strip()}",
+        detail=match["detail"].strip(),
+        priority=priority,
+    )
+
+
+class _GeminiCircuit:
+    """Skip Gemini for a cooldown after repeated consecutive failures.
+
+    During an outage every request would otherwise wait out a failing HTTP
+    call before falling back to the deterministic result.
+    """
+
+    def __init__(self, threshold: int = 3, window_seconds: float = 60.0, cooldown_seconds: float = 30.0) -> None:
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._failures = 0
+        self._first_failure_at = 0.0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """Return True while calls should be skipped."""
+
+        return time.monotonic() < self._open_until
+
+    def record_success(self) -> None:
+        """Reset the consecutive failure count."""
+
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit once ``threshold`` land inside the window."""
+
+        now = time.monotonic()
+        with self._lock:
+            if not self._failures or now - self._first_failure_at > self.window_seconds:
+                self._failures = 0
+                self._first_failure_at = now
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open_until = now + self.cooldown_seconds
+                self._failures = 0
+
+
+_gemini_circuit = _GeminiCircuit()
+
+
+def _stream_lines(chunks: Iterable[Any]) -> Iterator[str]:
+    """Re-split streamed response chunks into complete lines as they arrive."""
+
+    buffer = ""
+    for chunk in chunks:
+        buffer += getattr(chunk, "text", "")
+        *lines, buffer = buffer.split("\n")
+        yield from lines
+    if buffer:
+        yield buffer
+
+
+def _iter_gemini_insight(
     brief: FeatureBrief,
     launch_window: LaunchWindow,
-    slo_items: list[str],
+    slo_items: tuple[str, ...],
     rag_contexts: list[RetrievedContext],
     context: AgentRunContext,
-) -> tuple[str | None, list[AgentRecommendation]]:
-    """Use Gemini to generate intelligent insights based on gathered context.
+) -> Iterator[str | AgentRecommendation]:
+    """Yield Gemini's insight text and each recommendation as soon as it is parsed.
 
-    Returns a tuple of (insight_text, ai_recommendations).
+    The response is streamed and parsed line by line; once the insight and both
+    recommendations are in, the remaining tokens are not waited for.
     """
     settings = get_settings()
-    if not settings.gemini_api_key or genai is None:
-        return None, []
+    if not settings.gemini_api_key or genai is None or _gemini_circuit.is_open():
+        return
 
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel(os.getenv("GEMINI_MODEL", "gemini-2.0-flash"))
+        model_name = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+        model = get_model(settings.gemini_api_key, model_name)
 
         # Build rich context from all sources
         context_parts = [
@@ -121,73 +248,63 @@ def _generate_gemini_insight(
             context_parts.append(f"SLO Watch Items: {', '.join(slo_items)}")
 
         if rag_contexts:
-            rag_text = "\n".join([f"- ({ctx.source}) {ctx.content}" for ctx in rag_contexts])
+            rag_text = "\n".join(ctx.as_bullet for ctx in rag_contexts)
             context_parts.append(f"Related Documentation:\n{rag_text}")
 
         full_context = "\n".join(context_parts)
 
-        prompt = f"""You are a release readiness advisor helping teams prepare for feature launches.
-Based on the following context, provide:
-1. A brief strategic insight (2-3 sentences) about the launch readiness
-2. Two specific AI-generated recommendations with priority levels
-
-Context:
-{full_context}
-
-User's Launch Date: {context.launch_date}
-Include Risk Analysis: {context.include_risks}
-
-Respond in this exact format:
-INSIGHT: <your strategic insight here>
-RECOMMENDATION_1: <title>|<detail>|<priority: high/medium/low>
-RECOMMENDATION_2: <title>|<detail>|<priority: high/medium/low>"""
+        prompt = (
+            _PROMPT_HEAD
+            + full_context
+            + _PROMPT_TAIL.format(launch_date=context.launch_date, include_risks=context.include_risks)
+        )
 
-        response = model.generate_content(prompt)
-        response_text = getattr(response, "text", "").strip()
-
-        # Parse the response
-        insight = ""
-        ai_recommendations: list[AgentRecommendation] = []
-
-        for line in response_text.split("\n"):
-            line = line.strip()
-            if line.startswith("INSIGHT:"):
-                insight = line[8:].strip()
-            elif line.startswith("RECOMMENDATION_"):
-                parts = line.split(":", 1)
-                if len(parts) > 1:
-                    rec_parts = parts[1].strip().split("|")
-                    if len(rec_parts) >= 3:
-                        priority = rec_parts[2].strip().lower()
-                        if priority not in ("high", "medium", "low"):
-                            priority = "medium"
-                        ai_recommendations.append(
-                            AgentRecommendation(
-                                title=f"[AI] {rec_parts[0].strip()}",
-                                detail=rec_parts[1].strip(),
-                                priority=priority,
-                            )
-                        )
-
-        return insight if insight else None, ai_recommendations
-
-    except Exception as exc:
+        cache_key = LLMCache.key(model_name, prompt)
+        cached_text = gemini_cache.get(cache_key)
+        if cached_text is not None:
+            lines: Iterable[str] = cached_text.split("\n")
+        else:
+            lines = _stream_lines(model.generate_content(prompt, stream=True))
+
+        consumed: list[str] = []
+        has_insight = False
+        recommendation_count = 0
+        for line in lines:
+            consumed.append(line)
+            item = _parse_insight_line(line)
+            if item is None:
+                continue
+            if isinstance(item, AgentRecommendation):
+                recommendation_count += 1
+            else:
+                has_insight = True
+            yield item
+            if has_insight and recommendation_count >= 2:
+                break
+
+        response_text = "\n".join(consumed).strip()
+        if cached_text is None and response_text:
+            gemini_cache.set(cache_key, response_text)
+        _gemini_circuit.record_success()
+
+    except Exception:
         # Log but don't fail the agent if Gemini is unavailable
-        print(f"Gemini insight generation failed: {exc}")
-        return None, []
+        _gemini_circuit.record_failure()
+        logger.warning(
+            "Gemini insight generation failed", exc_info=True, extra={"feature_slug": context.feature_slug}
+        )
 
 
-def run_release_readiness_agent(
+def stream_release_readiness_agent(
     context: AgentRunContext,
     db: Session | None = None,
-) -> AgentRunResult:
-    """Coordinate tool calls, RAG retrieval, and Gemini to prepare a release readiness brief.
+) -> Iterator[AgentRunResult]:
+    """Yield progressively more complete release readiness results.
 
-    This agent demonstrates a complete integration of:
-    - Deterministic tool calls for structured data gathering
-    - FAISS-based RAG for retrieving relevant documentation
-    - Gemini AI for generating intelligent insights
-    - Database persistence for auditing and learning
+    The first frame carries everything the deterministic tools produce. Each
+    following frame adds the Gemini insight or another AI recommendation as
+    it streams in. The last frame is the complete result, yielded after the
+    run has been persisted.
     """
 
     try:
@@ -202,23 +319,20 @@ def run_release_readiness_agent(
             f"Launch window data is missing for feature '{context.feature_slug}'."
         ) from exc
 
-    contacts: list[SupportContact] = fetch_support_contacts(context.audience_role)
-    slo_watch_items: list[str] = list_slo_watch_items(context.feature_slug)
+    contacts: tuple[SupportContact, ...] = fetch_support_contacts(context.audience_role)
+    slo_watch_items: tuple[str, ...] = list_slo_watch_items(context.feature_slug)
 
     # Track tool calls for transparency
     tool_calls = [
         AgentToolCall(
             tool="fetch_feature_brief",
             arguments={"feature_slug": context.feature_slug},
-            output_preview=f"{brief.name}: {brief.summary}",
+            output_preview=feature_preview(context.feature_slug),
         ),
         AgentToolCall(
             tool="fetch_launch_window",
             arguments={"feature_slug": context.feature_slug},
-            output_preview=(
-                f"{launch_window.environment} window {launch_window.window_start.isoformat()}"
-                f" → {launch_window.window_end.isoformat()}"
-            ),
+            output_preview=launch_window_preview(context.feature_slug),
         ),
         AgentToolCall(
             tool="fetch_support_contacts",
@@ -236,12 +350,15 @@ def run_release_readiness_agent(
             )
         )
 
-    # RAG: Retrieve relevant documentation using FAISS
+    # RAG: Retrieve relevant documentation using the cached FAISS index
     rag_contexts: list[RetrievedContext] = []
     if db is not None:
-        retriever = build_retriever(db)
         search_query = f"{brief.name} {context.audience_role} release launch"
-        rag_contexts = retriever.search(search_query, k=3)
+        rag_contexts = get_cached_index(db).search(db, search_query, k=3)
+        # The session stays open until the stream ends; commit so the pooled
+        # connection is not held in a transaction while Gemini responds. The
+        # final persist checks out a fresh one.
+        db.commit()
         if rag_contexts:
             tool_calls.append(
                 AgentToolCall(
@@ -251,24 +368,6 @@ def run_release_readiness_agent(
                 )
             )
 
-    # Generate Gemini insight if available
-    gemini_insight, ai_recommendations = _generate_gemini_insight(
-        brief, launch_window, slo_watch_items, rag_contexts, context
-    )
-    used_gemini = gemini_insight is not None
-
-    if used_gemini:
-        insight_preview = ""
-        if gemini_insight:
-            insight_preview = gemini_insight[:100] + "..." if len(gemini_insight) > 100 else gemini_insight
-        tool_calls.append(
-            AgentToolCall(
-                tool="gemini_insight_generation",
-                arguments={"model": os.getenv("GEMINI_MODEL", "gemini-2.0-flash")},
-                output_preview=insight_preview,
-            )
-        )
-
     # Build the plan
     plan_request = PlanRequest(
         goal=f"Launch {brief.name} successfully",
@@ -281,7 +380,7 @@ def run_release_readiness_agent(
     # Generate summary
     summary = (
         f"{brief.name} targets {brief.audience_role} personas. "
-        f"Production window: {launch_window.window_start:%b %d}–{launch_window.window_end:%b %d}. "
+        f"Production window: {launch_window_range(context.feature_slug)}. "
         f"Success metric: {brief.success_metric}."
     )
 
@@ -326,15 +425,52 @@ def run_release_readiness_agent(
             )
         )
 
-    # Add AI-generated recommendations
-    recommended_actions.extend(ai_recommendations)
-
     # Convert RAG contexts to response format
     rag_context_response = [
         RAGContext(content=ctx.content, source=ctx.source, score=ctx.score)
         for ctx in rag_contexts
     ]
 
+    partial = AgentRunResult(
+        summary=summary,
+        recommended_actions=recommended_actions,
+        plan=plan,
+        tool_calls=list(tool_calls),
+        rag_contexts=rag_context_response,
+    )
+    yield partial
+
+    # Stream the Gemini insight and AI recommendations if available
+    gemini_insight: str | None = None
+    ai_recommendations: list[AgentRecommendation] = []
+    for item in _iter_gemini_insight(brief, launch_window, slo_watch_items, rag_contexts, context):
+        if isinstance(item, AgentRecommendation):
+            ai_recommendations.append(item)
+        else:
+            gemini_insight = item
+        yield partial.model_copy(
+            update={
+                "gemini_insight": gemini_insight,
+                "recommended_actions": [*recommended_actions, *ai_recommendations],
+            }
+        )
+    used_gemini = gemini_insight is not None
+
+    if used_gemini:
+        insight_preview = ""
+        if gemini_insight:
+            insight_preview = gemini_insight[:100] + "..." if len(gemini_insight) > 100 else gemini_insight
+        tool_calls.append(
+            AgentToolCall(
+                tool="gemini_insight_generation",
+                arguments={"model": os.getenv("GEMINI_MODEL", "gemini-2.0-flash")},
+                output_preview=insight_preview,
+            )
+        )
+
+    # Add AI-generated recommendations
+    recommended_actions.extend(ai_recommendations)
+
     result = AgentRunResult(
         summary=summary,
         gemini_insight=gemini_insight,
@@ -353,22 +489,75 @@ def run_release_readiness_agent(
             audience_experience=context.audience_experience,
             summary=summary,
             gemini_insight=gemini_insight,
-            recommended_actions=[rec.model_dump() for rec in recommended_actions],
-            tool_calls=[tc.model_dump() for tc in tool_calls],
-            rag_contexts=[ctx.model_dump() for ctx in rag_context_response],
+            # The engine's orjson serializer encodes these dataclasses directly,
+            # so there is no intermediate dict copy per record.
+            recommended_actions=list(recommended_actions),
+            tool_calls=list(tool_calls),
+            rag_contexts=list(rag_context_response),
             used_gemini=used_gemini,
         )
         db.add(agent_run)
         db.commit()
 
+    yield result
+
+
+def run_release_readiness_agent(
+    context: AgentRunContext,
+    db: Session | None = None,
+) -> AgentRunResult:
+    """Coordinate tool calls, RAG retrieval, and Gemini to prepare a release readiness brief.
+
+    This agent demonstrates a complete integration of:
+    - Deterministic tool calls for structured data gathering
+    - FAISS-based RAG for retrieving relevant documentation
+    - Gemini AI for generating intelligent insights
+    - Database persistence for auditing and learning
+    """
+
+    *_, result = stream_release_readiness_agent(context, db=db)
     return result
 
 
-def get_agent_history(db: Session, feature_slug: str | None = None, limit: int = 10) -> list[AgentRun]:
-    """Retrieve historical agent runs from the database."""
-    from sqlalchemy import select
+def get_agent_history(
+    db: Session,
+    feature_slug: str | None = None,
+    limit: int = 10,
+    before: datetime | None = None,
+    before_id: int | None = None,
+) -> list[Row[Any]]:
+    """Retrieve summary rows for historical agent runs, newest first.
+
+    Only the columns a history listing renders are selected, leaving the JSON
+    blobs to :func:`get_agent_run_detail`. Pass the ``created_at`` and ``id``
+    of the last row seen as ``before`` and ``before_id`` to fetch the next page
+    with an index seek instead of an ``OFFSET`` scan; the id breaks ties
+    between runs that share a timestamp.
+    """
 
-    query = select(AgentRun).order_by(AgentRun.created_at.desc()).limit(limit)
+    query = (
+        select(
+            AgentRun.id,
+            AgentRun.feature_slug,
+            AgentRun.audience_role,
+            AgentRun.summary,
+            AgentRun.gemini_insight,
+            AgentRun.used_gemini,
+            AgentRun.created_at,
+        )
+        .order_by(AgentRun.created_at.desc(), AgentRun.id.desc())
+        .limit(limit)
+    )
     if feature_slug:
         query = query.where(AgentRun.feature_slug == feature_slug)
-    return list(db.execute(query).scalars().all())
+    if before is not None and before_id is not None:
+        query = query.where(tuple_(AgentRun.created_at, AgentRun.id) < tuple_(before, before_id))
+    elif before is not None:
+        query = query.where(AgentRun.created_at < before)
+    return list(db.execute(query).all())
+
+
+def get_agent_run_detail(db: Session, run_id: int) -> AgentRun | None:
+    """Return one stored agent run including its recommendations, tool calls, and contexts."""
+
+    return db.get(AgentRun, run_id)
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, Mapping
 
-from pydantic import BaseModel, Field
 
-
-class FeatureBrief(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FeatureBrief:
     """Condensed product brief for a feature under development."""
 
     slug: str
@@ -19,18 +20,20 @@ class FeatureBrief(BaseModel):
     success_metric: str
 
 
-class LaunchWindow(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LaunchWindow:
     """Deployment window information tracked by the release team."""
 
     feature_slug: str
     environment: Literal["staging", "production"]
     window_start: date
     window_end: date
-    freeze_required: bool = Field(default=True)
-    notes: str = Field(default="")
+    freeze_required: bool = True
+    notes: str = ""
 
 
-class SupportContact(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SupportContact:
     """Contact details for teams who need proactive updates."""
 
     audience: str
@@ -38,7 +41,9 @@ class SupportContact(BaseModel):
     escalation_channel: str
 
 
-_FEATURE_BRIEFS: dict[str, FeatureBrief] = {
+# The catalog is fixed at import time; read-only views keep callers from
+# mutating the shared instances they are handed.
+_FEATURE_BRIEFS: Mapping[str, FeatureBrief] = MappingProxyType({
     "curriculum-pathways": FeatureBrief(
         slug="curriculum-pathways",
         name="Curriculum Pathways",
@@ -58,9 +63,9 @@ _FEATURE_BRIEFS: dict[str, FeatureBrief] = {
         audience_experience="advanced",
         success_metric="Daily active program managers increase by 25%",
     ),
-}
+})
 
-_LAUNCH_WINDOWS: dict[str, LaunchWindow] = {
+_LAUNCH_WINDOWS: Mapping[str, LaunchWindow] = MappingProxyType({
     "curriculum-pathways": LaunchWindow(
         feature_slug="curriculum-pathways",
         environment="production",
@@ -77,10 +82,10 @@ _LAUNCH_WINDOWS: dict[str, LaunchWindow] = {
         freeze_required=True,
         notes="Requires feature flag rollout 48 hours prior to launch.",
     ),
-}
+})
 
-_SUPPORT_DIRECTORY: dict[str, list[SupportContact]] = {
-    "Instructor": [
+_SUPPORT_DIRECTORY: Mapping[str, tuple[SupportContact, ...]] = MappingProxyType({
+    "Instructor": (
         SupportContact(
             audience="Instructor",
             contact="education-success@example.com",
@@ -91,62 +96,89 @@ _SUPPORT_DIRECTORY: dict[str, list[SupportContact]] = {
             contact="pedagogy-lead@example.com",
             escalation_channel="#curriculum-updates",
         ),
-    ],
-    "Program Manager": [
+    ),
+    "Program Manager": (
         SupportContact(
             audience="Program Manager",
             contact="program-ops@example.com",
             escalation_channel="#program-ops",
         ),
-    ],
-}
+    ),
+})
 
-_SLO_WATCH_ITEMS: dict[str, list[str]] = {
-    "curriculum-pathways": [
+_SLO_WATCH_ITEMS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "curriculum-pathways": (
         "Lesson ingestion latency must stay under 2 minutes",
         "Planner responses require >95% schema compliance",
-    ],
-    "team-analytics": [
+    ),
+    "team-analytics": (
         "Dashboard queries should resolve under 1.5 seconds",
         "Background aggregation jobs must remain below 75% CPU utilization",
-    ],
-}
+    ),
+})
+
+# Strings the agent renders on every run, formatted once for the fixed catalog.
+_FEATURE_PREVIEWS: Mapping[str, str] = MappingProxyType(
+    {slug: f"{brief.name}: {brief.summary}" for slug, brief in _FEATURE_BRIEFS.items()}
+)
+_WINDOW_PREVIEWS: Mapping[str, str] = MappingProxyType(
+    {
+        slug: f"{window.environment} window {window.window_start.isoformat()} → {window.window_end.isoformat()}"
+        for slug, window in _LAUNCH_WINDOWS.items()
+    }
+)
+_WINDOW_RANGES: Mapping[str, str] = MappingProxyType(
+    {slug: f"{window.window_start:%b %d}–{window.window_end:%b %d}" for slug, window in _LAUNCH_WINDOWS.items()}
+)
 
 
 def fetch_feature_brief(feature_slug: str) -> FeatureBrief:
     """Return the canonical product brief for the requested feature."""
 
-    brief = _FEATURE_BRIEFS.get(feature_slug)
-    if brief is None:
-        raise KeyError(feature_slug)
-    return brief
+    return _FEATURE_BRIEFS[feature_slug]  # Unknown slugs raise KeyError.
 
 
 def fetch_launch_window(feature_slug: str) -> LaunchWindow:
     """Fetch the release window associated with the feature."""
 
-    window = _LAUNCH_WINDOWS.get(feature_slug)
-    if window is None:
-        raise KeyError(feature_slug)
-    return window
+    return _LAUNCH_WINDOWS[feature_slug]
 
 
-def fetch_support_contacts(audience_role: str) -> list[SupportContact]:
+def fetch_support_contacts(audience_role: str) -> tuple[SupportContact, ...]:
     """Return the set of contacts who should be looped in for updates."""
 
-    contacts = _SUPPORT_DIRECTORY.get(audience_role)
-    if contacts:
-        return contacts
-    return [
-        SupportContact(
-            audience=audience_role,
-            contact="success@example.com",
-            escalation_channel="#general-updates",
+    try:
+        return _SUPPORT_DIRECTORY[audience_role]
+    except KeyError:
+        # The fallback names the caller's audience, so it is built per miss.
+        return (
+            SupportContact(
+                audience=audience_role,
+                contact="success@example.com",
+                escalation_channel="#general-updates",
+            ),
         )
-    ]
 
 
-def list_slo_watch_items(feature_slug: str) -> list[str]:
+def list_slo_watch_items(feature_slug: str) -> tuple[str, ...]:
     """List performance and reliability signals for the feature."""
 
-    return _SLO_WATCH_ITEMS.get(feature_slug, [])
+    return _SLO_WATCH_ITEMS.get(feature_slug, ())
+
+
+def feature_preview(feature_slug: str) -> str:
+    """Return the precomputed ``name: summary`` line for a known feature."""
+
+    return _FEATURE_PREVIEWS[feature_slug]
+
+
+def launch_window_preview(feature_slug: str) -> str:
+    """Return the precomputed environment and ISO date span of a launch window."""
+
+    return _WINDOW_PREVIEWS[feature_slug]
+
+
+def launch_window_range(feature_slug: str) -> str:
+    """Return the precomputed short ``Mon DD–Mon DD`` span of a launch window."""
+
+    return _WINDOW_RANGES[feature_slug]
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Iterator
 
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.services import gemini
-from app.services.rag import RetrievedContext, build_retriever
+from app.services.llm_cache import LLMCache, gemini_cache
+from app.services.rag import ChunkIndex, RetrievedContext, search_chunks
 from app.services.resources import list_resources
 
 try:  # pragma: no cover - optional dependency
@@ -18,6 +19,10 @@ except Exception:  # pragma: no cover
     genai = None
 
 
+class ChatStreamInterrupted(RuntimeError):
+    """Raised when Gemini fails after part of the answer was already streamed."""
+
+
 @dataclass
 class AgentStep:
     name: str
@@ -33,9 +38,7 @@ class ChatResult:
 
 
 def _build_prompt(message: str, contexts: list[RetrievedContext]) -> str:
-    context_block = "\n".join(
-        [f"- ({ctx.source}) {ctx.content}" for ctx in contexts]
-    )
+    context_block = "\n".join(ctx.as_bullet for ctx in contexts)
     instructions = (
         "You are an assistant helping students navigate the AI in Web course. "
         "Use the provided context snippets when they are relevant. If the context "
@@ -44,11 +47,25 @@ def _build_prompt(message: str, contexts: list[RetrievedContext]) -> str:
     return f"{instructions}\n\nContext:\n{context_block}\n\nStudent: {message}\nAssistant:"
 
 
-def run_chat(message: str, db: Session) -> ChatResult:
-    """Run the RAG chatbot and return structured context + response."""
+@dataclass
+class ChatTurn:
+    """Everything gathered from the database before the answer is generated."""
+
+    prompt: str
+    contexts: list[RetrievedContext]
+    steps: list[AgentStep]
+
+
+def prepare_chat(message: str, db: Session, index: ChunkIndex | None = None) -> ChatTurn:
+    """Retrieve context and run agent steps; the only part that needs ``db``.
+
+    When the process-wide FAISS ``index`` is available retrieval stays in
+    memory; otherwise the nearest chunks are ranked by pgvector in Postgres.
+    The read transaction is ended before returning, so the pooled connection
+    is free while the answer is generated.
+    """
 
-    retriever = build_retriever(db)
-    contexts = retriever.search(message, k=4)
+    contexts = index.search(db, message, k=4) if index is not None else search_chunks(db, message, k=4)
     steps: list[AgentStep] = []
 
     # Lightweight "agent" behaviour: surface course resources when asked.
@@ -57,28 +74,70 @@ def run_chat(message: str, db: Session) -> ChatResult:
         summary = ", ".join(resource.title for resource in resources)
         steps.append(AgentStep(name="fetch_resources", detail=f"Suggested: {summary}"))
 
-    settings = get_settings()
-    answer = ""
-    used_gemini = False
-    prompt = _build_prompt(message, contexts)
+    # ``get_db`` keeps the session open until the response finishes; commit
+    # now so it does not sit idle in a transaction through the Gemini stream.
+    db.commit()
+    return ChatTurn(prompt=_build_prompt(message, contexts), contexts=contexts, steps=steps)
+
+
+def stream_chat_answer(turn: ChatTurn) -> Iterator[tuple[str, bool]]:
+    """Yield ``(delta, used_gemini)`` pairs as the answer is produced.
+
+    Gemini output is forwarded chunk by chunk so callers can start rendering
+    after the first token instead of waiting for the full generation. A failure
+    after text was already sent raises :class:`ChatStreamInterrupted` rather
+    than gluing an error message onto the partial answer.
+    """
+
+    cache_key = LLMCache.key("gemini-2.0-flash", turn.prompt)
+    cached_answer = gemini_cache.get(cache_key)
+    if cached_answer is not None:
+        yield cached_answer, True
+        return
 
+    settings = get_settings()
     if settings.gemini_api_key and genai is not None:
-        gemini._configure_client(settings.gemini_api_key)
-        model = genai.GenerativeModel("gemini-2.0-flash")
+        model = gemini.get_model(settings.gemini_api_key, "gemini-2.0-flash")
+        parts: list[str] = []
         try:  # pragma: no cover - depends on remote call
-            response = model.generate_content(prompt)
-            answer = getattr(response, "text", "").strip()
-            used_gemini = True
+            for chunk in model.generate_content(turn.prompt, stream=True):
+                text = getattr(chunk, "text", "")
+                if text:
+                    parts.append(text)
+                    yield text, True
         except Exception as exc:  # pragma: no cover
-            answer = (
+            if parts:
+                raise ChatStreamInterrupted(f"Gemini stopped mid-answer: {exc}") from exc
+            yield (
                 "Gemini request failed; falling back to a locally generated summary. "
                 f"Error: {exc}"
-            )
+            ), False
+            return
+        answer = "".join(parts).strip()
+        if answer:
+            gemini_cache.set(cache_key, answer)
+            return
+
+    # Fallback deterministic response so the classroom can continue offline.
+    combined_sources = "\n".join(ctx.content for ctx in turn.contexts) or "No context available."
+    yield f"(offline preview) Based on the notes: {combined_sources[:400]}", False
 
-    if not answer:
-        # Fallback deterministic response so the classroom can continue offline.
-        combined_sources = "\n".join(ctx.content for ctx in contexts) or "No context available."
-        answer = f"(offline preview) Based on the notes: {combined_sources[:400]}"
 
-    return ChatResult(answer=answer, contexts=contexts, steps=steps, used_gemini=used_gemini)
+def run_chat(message: str, db: Session, index: ChunkIndex | None = None) -> ChatResult:
+    """Run the RAG chatbot and return structured context + response."""
 
+    turn = prepare_chat(message, db, index=index)
+    parts: list[str] = []
+    used_gemini = False
+    try:
+        for delta, from_gemini in stream_chat_answer(turn):
+            parts.append(delta)
+            used_gemini = used_gemini or from_gemini
+    except ChatStreamInterrupted as exc:
+        parts.append(f"\n\n[Answer incomplete: {exc}]")
+    return ChatResult(
+        answer="".join(parts).strip(),
+        contexts=turn.contexts,
+        steps=turn.steps,
+        used_gemini=used_gemini,
+    )
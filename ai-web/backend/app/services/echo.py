@@ -6,7 +6,8 @@ matches the separation of concerns demonstrated in the accompanying lab
 notebooks and gives instructors a concrete example to reference in class.
 """
 
-from sqlalchemy import select
+from sqlalchemy import case, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.models import EchoAttempt
@@ -41,27 +42,35 @@ def get_flaky_echo_payload(
             window and needs the client to retry.
     """
 
-    key = f"{client_host}:{failures}"
-    result = db.execute(
-        select(EchoAttempt).where(EchoAttempt.client_key == key, EchoAttempt.failures == failures)
-    ).scalar_one_or_none()
-
-    if result is None:
-        result = EchoAttempt(client_key=key, failures=failures, attempts=0, message=message)
-        db.add(result)
-        db.commit()
-        db.refresh(result)
-
-    if result.attempts < failures:
-        result.attempts += 1
-        db.add(result)
-        db.commit()
-        raise EchoServiceError("Simulated transient failure")
+    if failures == 0:
+        # Nothing to count: the first call succeeds, and skipping the write keeps
+        # these calls from adding a row each (the upsert index only covers > 0).
+        return {"msg": message, "attempts": 1}
 
-    attempts = result.attempts + 1  # Count the successful request as an attempt.
-    result.attempts = 0
-    result.message = message
-    db.add(result)
+    key = f"{client_host}:{failures}"
+    # One atomic upsert per call: create the counter row or advance it, starting
+    # a new cycle once the previous call succeeded. Concurrent retries queue on
+    # the row inside Postgres instead of racing a SELECT-then-UPDATE.
+    insert_stmt = insert(EchoAttempt).values(
+        client_key=key, failures=failures, attempts=1, message=message
+    )
+    attempts = db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[EchoAttempt.client_key, EchoAttempt.failures],
+            index_where=text("failures > 0"),
+            set_={
+                "attempts": case(
+                    (EchoAttempt.attempts > EchoAttempt.failures, 1),
+                    else_=EchoAttempt.attempts + 1,
+                ),
+                "message": insert_stmt.excluded.message,
+            },
+        ).returning(EchoAttempt.attempts)
+    ).scalar_one()
     db.commit()
 
+    if attempts <= failures:
+        raise EchoServiceError("Simulated transient failure")
+
+    # The successful request counts as an attempt; the next call starts over.
     return {"msg": message, "attempts": attempts}
@@ -60,6 +60,18 @@ def _configure_client(api_key: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=8)
+def get_model(api_key: str, model_name: str):
+    """Return a ``GenerativeModel`` built once per API key and model name.
+
+    Chat, agent, and outline requests reuse the same instance instead of
+    reconfiguring the SDK and constructing a model on every call.
+    """
+
+    _configure_client(api_key)
+    return genai.GenerativeModel(model_name)
+
+
 def _parse_outline_lines(raw_outline: str) -> List[str]:
     """Convert the model response into a clean list of outline bullet points.
 
@@ -104,11 +116,11 @@ def generate_lesson_outline(topic: str, model: str | None = None) -> dict[str, s
         raise ValueError("Topic must not be empty.")
 
     api_key = _require_api_key()
-    _configure_client(api_key)  # Cache-aware setup keeps repeated requests fast.
 
     selected_model = model or os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
     try:
-        generative_model = genai.GenerativeModel(selected_model)
+        # Cache-aware setup keeps repeated requests fast.
+        generative_model = get_model(api_key, selected_model)
         prompt = (
             "You are helping an instructor design a web programming lesson. "
             "Return a concise outline with 3-5 bullet points that cover the key "
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from sqlalchemy import Text, cast, literal
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from pydantic import ValidationError
@@ -67,6 +69,29 @@ _ADVANCED_STEP = {
 }
 
 
+_StepTemplate = tuple[str, tuple[str, ...], str, int, tuple[str, ...]]
+
+
+def _step_template(step: dict[str, Any]) -> _StepTemplate:
+    """Pre-split a library step around "this plan" so only the goal is spliced in per call."""
+
+    return (
+        step["title"].strip(),
+        tuple(step["description"].strip().split("this plan")),
+        step["owner"],
+        step["duration_minutes"],
+        tuple(step["acceptance_criteria"]),
+    )
+
+
+_DEFAULT_TEMPLATES: tuple[_StepTemplate, ...] = tuple(_step_template(step) for step in _DEFAULT_STEP_LIBRARY)
+# Step order per experience level, resolved once at import.
+_STEP_TEMPLATES: dict[str, tuple[_StepTemplate, ...]] = {
+    "beginner": (_DEFAULT_TEMPLATES[0], _step_template(_BEGINNER_STEP), *_DEFAULT_TEMPLATES[1:]),
+    "advanced": (*_DEFAULT_TEMPLATES, _step_template(_ADVANCED_STEP)),
+}
+
+
 def build_plan(request: PlanRequest) -> Plan:
     """Create a structured plan tailored for the requested audience."""
 
@@ -102,12 +127,13 @@ def save_plan_run(db: Session, request: PlanRequest, plan: Plan) -> PlanRun:
         primary_risk=request.primary_risk,
         include_risks=True,
         summary=summary,
-        # Ensure datetimes and other values are JSON-serializable for JSONB storage.
-        plan=plan.model_dump(mode="json"),
+        # Hand Postgres the JSON text pydantic already produced and cast it
+        # server-side, rather than dumping to a dict for psycopg2 to re-encode.
+        # Binding as Text matters: a JSONB-typed bind would encode it again.
+        plan=cast(literal(plan.model_dump_json(), Text), JSONB),
     )
     db.add(run)
     db.commit()
-    db.refresh(run)
     return run
 
 
@@ -141,44 +167,47 @@ def validate_plan_payload(payload: dict[str, Any]) -> PlanValidationResult:
 def _compose_steps(goal: str, experience_level: str) -> list[dict[str, Any]]:
     """Generate plan steps based on the target audience."""
 
-    steps: list[dict[str, Any]] = []
-    for template in _DEFAULT_STEP_LIBRARY:
-        updated = dict(template)
-        updated["description"] = template["description"].replace("this plan", f'"{goal}"')
-        steps.append(updated)
-
-    if experience_level == "beginner":
-        steps.insert(1, dict(_BEGINNER_STEP))
-    elif experience_level == "advanced":
-        steps.append(dict(_ADVANCED_STEP))
-
-    for idx, step in enumerate(steps, start=1):
-        step.setdefault("acceptance_criteria", [])
-        step.setdefault("owner", "Project Lead")
-        step.setdefault("duration_minutes", 45)
-        step["title"] = step["title"].strip()
-        step["description"] = step["description"].strip()
-        step.setdefault(
-            "acceptance_criteria",
-            [f"Step {idx} outputs documented"],
+    quoted_goal = f'"{goal}"'
+    return [
+        {
+            "title": title,
+            "description": quoted_goal.join(description_parts),
+            "owner": owner,
+            "duration_minutes": duration_minutes,
+            "acceptance_criteria": list(criteria),
+        }
+        for title, description_parts, owner, duration_minutes, criteria in _STEP_TEMPLATES.get(
+            experience_level, _DEFAULT_TEMPLATES
         )
-    return steps
+    ]
+
+
+_VALID_EXPERIENCE = frozenset({"beginner", "intermediate", "advanced"})
+
+
+def _clean_text(value: Any, default: str) -> str:
+    """Return ``value`` stripped, or ``default`` when it is missing or blank."""
+
+    if not value:
+        return default
+    text = value.strip() if isinstance(value, str) else str(value).strip()
+    return text or default
 
 
 def _repair_payload(payload: dict[str, Any]) -> dict[str, Any]:
     """Attempt to coerce a loosely structured payload into a valid plan."""
 
-    cleaned_goal = str(payload.get("goal", "Unspecified goal")).strip() or "Unspecified goal"
+    cleaned_goal = _clean_text(payload.get("goal"), "Unspecified goal")
 
     audience_data = payload.get("audience")
     if isinstance(audience_data, dict):
-        role = str(audience_data.get("role", "Cross-functional team")).strip() or "Cross-functional team"
+        role = _clean_text(audience_data.get("role"), "Cross-functional team")
         experience = audience_data.get("experience_level", "intermediate")
     else:
         role = "Cross-functional team"
         experience = "intermediate"
 
-    if experience not in {"beginner", "intermediate", "advanced"}:
+    if experience not in _VALID_EXPERIENCE:
         experience = "intermediate"
 
     raw_steps = payload.get("steps")
@@ -187,30 +216,28 @@ def _repair_payload(payload: dict[str, Any]) -> dict[str, Any]:
         for index, item in enumerate(raw_steps, start=1):
             if not isinstance(item, dict):
                 continue
-            title = str(item.get("title") or f"Step {index}").strip() or f"Step {index}"
-            description = str(item.get("description") or f"Document progress for {title}.").strip()
-            owner = str(item.get("owner") or "Project Lead").strip() or "Project Lead"
+            title = _clean_text(item.get("title"), f"Step {index}")
             duration = item.get("duration_minutes")
-            try:
-                duration_int = int(duration)
-            except (TypeError, ValueError):
-                duration_int = 45
-            duration_int = max(5, min(duration_int, 240))
+            if isinstance(duration, int):
+                duration_int = duration
+            else:
+                try:
+                    duration_int = int(duration)
+                except (TypeError, ValueError):
+                    duration_int = 45
 
             criteria = item.get("acceptance_criteria")
-            if not isinstance(criteria, list):
-                criteria = []
-            cleaned_criteria = [str(entry).strip() for entry in criteria if str(entry).strip()]
-            if not cleaned_criteria:
-                cleaned_criteria = [f"Document completion of {title}."]
+            cleaned_criteria = (
+                [text for entry in criteria if (text := str(entry).strip())] if isinstance(criteria, list) else []
+            )
 
             cleaned_steps.append(
                 {
                     "title": title,
-                    "description": description or f"Document progress for {title}.",
-                    "owner": owner,
-                    "duration_minutes": duration_int,
-                    "acceptance_criteria": cleaned_criteria,
+                    "description": _clean_text(item.get("description"), f"Document progress for {title}."),
+                    "owner": _clean_text(item.get("owner"), "Project Lead"),
+                    "duration_minutes": max(5, min(duration_int, 240)),
+                    "acceptance_criteria": cleaned_criteria or [f"Document completion of {title}."],
                 }
             )
 
@@ -220,7 +247,7 @@ def _repair_payload(payload: dict[str, Any]) -> dict[str, Any]:
     risks = payload.get("risks")
     cleaned_risks: list[str] = []
     if isinstance(risks, list):
-        cleaned_risks = [str(item).strip() for item in risks if str(item).strip()][:3]
+        cleaned_risks = [text for item in risks if (text := str(item).strip())][:3]
 
     repaired_payload = {
         "goal": cleaned_goal,
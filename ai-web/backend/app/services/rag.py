@@ -1,101 +1,345 @@
-"""Simple retrieval helper backed by FAISS and hashed bag-of-words embeddings."""
+"""Retrieval helpers backed by pgvector, FAISS, and hashed bag-of-words embeddings."""
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
 import re
-from dataclasses import dataclass
+import threading
+import zlib
+from dataclasses import dataclass, field
 from functools import lru_cache
+from types import ModuleType
 from typing import Iterable, Sequence
 
-import faiss  # type: ignore
 import numpy as np
-from sqlalchemy import select
+from sqlalchemy import Text, case, cast, func, select, update
 from sqlalchemy.orm import Session
 
-from app.models import DocumentChunk
+from app.config import get_settings
+from app.models import EMBED_DIM, DocumentChunk
+from app.services.llm_cache import LLMCache
 
-EMBED_DIM = 256
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _faiss() -> ModuleType:
+    """Import FAISS on first use so importing the app does not load it and its BLAS."""
+
+    import faiss  # type: ignore
+
+    return faiss
+
+
+_TOKEN_RE = re.compile(r"\b\w+\b")
 
 
 def _tokenize(text: str) -> list[str]:
-    return re.findall(r"\b\w+\b", text.lower())
+    return _TOKEN_RE.findall(text.lower())
 
 
 def embed_text(text: str) -> np.ndarray:
     """Create a deterministic hashed embedding without external dependencies."""
 
-    vector = np.zeros(EMBED_DIM, dtype="float32")
-    for token in _tokenize(text):
-        vector[hash(token) % EMBED_DIM] += 1.0
-    norm = np.linalg.norm(vector)
-    if norm:
-        vector /= norm
+    tokens = _tokenize(text)
+    if not tokens:
+        return np.zeros(EMBED_DIM, dtype="float32")
+    # CRC32 rather than ``hash()``: str hashes are salted per process, so
+    # vectors stored by one worker would not match queries embedded by another.
+    buckets = np.fromiter(
+        (zlib.crc32(token.encode("utf-8")) for token in tokens), dtype="int64", count=len(tokens)
+    ) % EMBED_DIM
+    vector = np.bincount(buckets, minlength=EMBED_DIM).astype("float32")
+    vector /= np.sqrt(vector @ vector)
     return vector
 
 
+@lru_cache(maxsize=4096)
+def _embed_query_bytes(text: str) -> bytes:
+    return embed_text(text).tobytes()
+
+
+def embed_query(text: str) -> np.ndarray:
+    """Return the read-only embedding of a search query, memoized per text.
+
+    Chat questions repeat across users, so hot queries skip tokenizing and
+    hashing. Chunk ingestion keeps calling :func:`embed_text` directly so one
+    large import does not evict every cached query.
+    """
+
+    return np.frombuffer(_embed_query_bytes(text), dtype="float32")
+
+
 @dataclass
 class RetrievedContext:
     content: str
     source: str
     score: float
+    # Prompt line for this snippet, formatted once; cached search results are
+    # shared across requests, so every later prompt reuses the same string.
+    as_bullet: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.as_bullet = f"- ({self.source}) {self.content}"
+
+
+def embed_missing_chunks(db: Session) -> int:
+    """Compute embeddings for stored chunks that do not have one yet."""
+
+    missing = db.execute(
+        select(DocumentChunk.id, DocumentChunk.content).where(DocumentChunk.embedding.is_(None))
+    ).all()
+    if missing:
+        # ORM bulk UPDATE by primary key: one batched statement, no loaded objects.
+        db.execute(
+            update(DocumentChunk),
+            [{"id": row.id, "embedding": embed_text(row.content)} for row in missing],
+        )
+        db.commit()
+    return len(missing)
+
+
+def search_chunks(db: Session, query: str, k: int = 3) -> list[RetrievedContext]:
+    """Rank stored chunks inside Postgres using the pgvector HNSW index.
+
+    Only the ``k`` nearest rows travel back over the wire, so the caller never
+    loads or decodes the full embedding table.
+    """
+
+    embed_missing_chunks(db)
+    distance = DocumentChunk.embedding.cosine_distance(embed_query(query))
+    rows = db.execute(
+        select(DocumentChunk.content, DocumentChunk.source, distance.label("score"))
+        .where(DocumentChunk.embedding.is_not(None))
+        .order_by(distance)
+        .limit(k)
+    ).all()
+    return [RetrievedContext(content=row.content, source=row.source, score=float(row.score)) for row in rows]
+
+
+# Below this many vectors an exact scan is as fast as walking the HNSW graph.
+HNSW_MIN_VECTORS = 2048
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+# Bump when the index layout or metric changes so stale on-disk caches are skipped.
+_INDEX_FORMAT_VERSION = 4
+
+
+class ChunkIndex:
+    """Process-wide FAISS index over chunk embeddings keyed by row id.
+
+    The index is built once at startup so chat requests skip the vector scan
+    entirely and only fetch ``content``/``source`` for the ids it returns.
+    Vectors are L2-normalized, stored as 8-bit scalar-quantized codes, and
+    compared by inner product (cosine); corpora of ``HNSW_MIN_VECTORS`` or more
+    use an HNSW graph, smaller ones a flat scan.
 
+    Search results are cached per ``(query, k)`` on the instance. A corpus
+    change swaps in a new index (see :func:`get_cached_index`), which drops
+    the old results along with it.
+    """
 
-class Retriever:
-    """Tiny wrapper around a FAISS index so the chatbot can fetch context."""
-
-    def __init__(self, chunks: Sequence[DocumentChunk]):
-        self.chunks = list(chunks)
-        if not self.chunks:
-            self.index = None
-            return
-
-        self.index = faiss.IndexFlatL2(EMBED_DIM)
-        embeddings = np.stack([np.array(chunk.embedding, dtype="float32") for chunk in self.chunks])
-        self.index.add(embeddings)
-
-    def search(self, query: str, k: int = 3) -> list[RetrievedContext]:
-        if not self.index or not self.chunks:
-            return []
-
-        query_vector = np.expand_dims(embed_text(query), axis=0)
-        distances, indices = self.index.search(query_vector, min(k, len(self.chunks)))
-        results: list[RetrievedContext] = []
-        for score, idx in zip(distances[0], indices[0]):
-            if idx == -1:
-                continue
-            chunk = self.chunks[idx]
-            results.append(
-                RetrievedContext(content=chunk.content, source=chunk.source, score=float(score))
+    def __init__(self, ids: Sequence[int], vectors: np.ndarray, neighbors: int = 32):
+        faiss = _faiss()
+        self.ids = np.asarray(ids, dtype="int64")
+        # 8-bit scalar quantization stores one byte per dimension instead of four.
+        if len(self.ids) >= HNSW_MIN_VECTORS:
+            self.index = faiss.IndexHNSWSQ(
+                EMBED_DIM, faiss.ScalarQuantizer.QT_8bit, neighbors, faiss.METRIC_INNER_PRODUCT
             )
-        return results
+            self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        else:
+            self.index = faiss.IndexScalarQuantizer(
+                EMBED_DIM, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        vectors = np.ascontiguousarray(vectors, dtype="float32")
+        faiss.normalize_L2(vectors)
+        if len(vectors):
+            # Learns the per-dimension value range the 8-bit codes span.
+            self.index.train(vectors)
+            self.index.add(vectors)
+        self._setup()
+
+    def _setup(self) -> None:
+        if isinstance(self.index, _faiss().IndexHNSW):
+            self.index.hnsw.efSearch = HNSW_EF_SEARCH
+        settings = get_settings()
+        self._results: LLMCache[list[RetrievedContext]] = LLMCache(
+            maxsize=settings.query_cache_size, ttl_seconds=settings.query_cache_ttl
+        )
+
+    @classmethod
+    def read(cls, path: str) -> "ChunkIndex":
+        """Load an index previously saved with :meth:`write`."""
+
+        chunk_index = cls.__new__(cls)
+        chunk_index.index = _faiss().read_index(f"{path}.index")
+        chunk_index.ids = np.load(f"{path}.ids.npy")
+        if chunk_index.index.ntotal != len(chunk_index.ids):
+            raise ValueError(f"FAISS cache at {path} is inconsistent")
+        chunk_index._setup()
+        return chunk_index
+
+    def write(self, path: str) -> None:
+        """Persist the index and its id mapping next to each other on disk."""
+
+        # Write to temporary names first so concurrent workers never read a
+        # half-written file.
+        _faiss().write_index(self.index, f"{path}.index.tmp")
+        with open(f"{path}.ids.npy.tmp", "wb") as handle:
+            np.save(handle, self.ids)
+        os.replace(f"{path}.ids.npy.tmp", f"{path}.ids.npy")
+        os.replace(f"{path}.index.tmp", f"{path}.index")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, db: Session, query: str, k: int = 3) -> list[RetrievedContext]:
+        return self.search_batch(db, [query], k)[0]
+
+    def search_batch(self, db: Session, queries: Sequence[str], k: int = 3) -> list[list[RetrievedContext]]:
+        """Answer several queries with one FAISS call and one row lookup.
+
+        Cached queries are served from the result cache; the rest are stacked
+        into a single ``(M, EMBED_DIM)`` matrix for the index.
+        """
+
+        if not len(self):
+            return [[] for _ in queries]
+
+        keys = [f"{hashlib.blake2b(query.encode('utf-8'), digest_size=16).hexdigest()}:{k}" for query in queries]
+        results = [self._results.get(key) for key in keys]
+        misses = [position for position, cached in enumerate(results) if cached is None]
+        if misses:
+            matrix = np.stack([embed_query(queries[position]) for position in misses])
+            similarities, positions = self.index.search(matrix, min(k, len(self)))
+            # Report cosine distance so scores match those from ``search_chunks``.
+            rankings = [
+                {int(self.ids[pos]): 1.0 - float(sim) for sim, pos in zip(sim_row, pos_row) if pos != -1}
+                for sim_row, pos_row in zip(similarities, positions)
+            ]
+            rows = db.execute(
+                select(DocumentChunk.id, DocumentChunk.content, DocumentChunk.source).where(
+                    DocumentChunk.id.in_(list(set().union(*rankings)))
+                )
+            ).all()
+            by_id = {row.id: row for row in rows}
+            for position, ranked in zip(misses, rankings):
+                results[position] = self._results.set(
+                    keys[position],
+                    [
+                        RetrievedContext(content=by_id[chunk_id].content, source=by_id[chunk_id].source, score=score)
+                        for chunk_id, score in ranked.items()
+                        if chunk_id in by_id
+                    ],
+                )
+        return [list(cached) for cached in results]
+
+
+def load_chunk_index(db: Session) -> ChunkIndex:
+    """Build the in-process FAISS index, embedding chunks that lack a vector on the way.
 
+    One projection returns every stored vector as pgvector text plus the
+    content of only the rows still missing one; those are embedded straight
+    into the matrix and written back in a single bulk UPDATE.
+    """
 
-def ensure_embeddings(db: Session) -> list[DocumentChunk]:
-    """Compute embeddings for stored chunks when they are missing."""
+    rows = db.execute(
+        select(
+            DocumentChunk.id,
+            cast(DocumentChunk.embedding, Text).label("embedding"),
+            case((DocumentChunk.embedding.is_(None), DocumentChunk.content)).label("content"),
+        )
+    ).all()
+    stored = [row for row in rows if row.embedding is not None]
+    missing = [row for row in rows if row.embedding is None]
 
-    chunks = db.execute(select(DocumentChunk)).scalars().all()
-    updated = False
-    for chunk in chunks:
-        if not chunk.embedding:
-            vector = embed_text(chunk.content)
-            chunk.embedding = vector.tolist()
-            db.add(chunk)
-            updated = True
-    if updated:
+    vectors = np.empty((len(rows), EMBED_DIM), dtype="float32")
+    if stored:
+        # Parse all stored vectors ("[0.1,0.2,...]") with one NumPy call
+        # instead of materializing a Python float list per row.
+        vectors[: len(stored)] = np.fromstring(
+            ",".join(row.embedding[1:-1] for row in stored), dtype="float32", sep=","
+        ).reshape(len(stored), EMBED_DIM)
+    for position, row in enumerate(missing, start=len(stored)):
+        vectors[position] = embed_text(row.content)
+    if missing:
+        db.execute(
+            update(DocumentChunk),
+            [{"id": row.id, "embedding": vectors[position]} for position, row in enumerate(missing, start=len(stored))],
+        )
         db.commit()
-    return chunks
+    return ChunkIndex([row.id for row in stored] + [row.id for row in missing], vectors)
 
 
-@lru_cache(maxsize=1)
-def _empty_retriever() -> Retriever:
-    return Retriever([])
+_index_lock = threading.Lock()
+_cached_index: tuple[tuple[int, int, int | None], ChunkIndex] | None = None
+
+
+def _corpus_fingerprint(db: Session) -> tuple[int, int, int | None]:
+    """Return a cheap ``(rows, embedded rows, max id)`` signature of the chunk table."""
+
+    rows, embedded, max_id = db.execute(
+        select(func.count(DocumentChunk.id), func.count(DocumentChunk.embedding), func.max(DocumentChunk.id))
+    ).one()
+    return rows, embedded, max_id
+
+
+def _index_cache_path(fingerprint: tuple[int, int, int | None]) -> str | None:
+    """Return the on-disk location for an index of this corpus, if caching is enabled."""
+
+    settings = get_settings()
+    if not settings.faiss_cache_dir:
+        return None
+    key = hashlib.sha256(f"{settings.database_url}|{EMBED_DIM}|{_INDEX_FORMAT_VERSION}|{fingerprint}".encode("utf-8")).hexdigest()
+    return os.path.join(settings.faiss_cache_dir, key[:32])
+
+
+def _load_or_build_index(
+    db: Session, fingerprint: tuple[int, int, int | None]
+) -> tuple[tuple[int, int, int | None], ChunkIndex]:
+    """Read the index for ``fingerprint`` from disk, building and saving it on a miss.
+
+    Returns the fingerprint of the corpus the index actually covers, which
+    differs from the input when the build embedded missing vectors.
+    """
+
+    rows, embedded, _ = fingerprint
+    # A corpus with unembedded rows is about to change, so no saved copy can match it.
+    path = _index_cache_path(fingerprint) if embedded == rows else None
+    if path is not None and os.path.exists(f"{path}.index"):
+        try:
+            return fingerprint, ChunkIndex.read(path)
+        except Exception:  # A corrupt or incompatible file just means a rebuild.
+            logger.warning("Ignoring unreadable FAISS cache at %s", path, exc_info=True)
+
+    chunk_index = load_chunk_index(db)
+    size = len(chunk_index)
+    fingerprint = (size, size, int(chunk_index.ids.max()) if size else None)
+    path = _index_cache_path(fingerprint)
+    if path is not None:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            chunk_index.write(path)
+        except OSError:
+            logger.warning("Could not persist FAISS cache to %s", path, exc_info=True)
+    return fingerprint, chunk_index
+
 
+def get_cached_index(db: Session) -> ChunkIndex:
+    """Return the process-wide chunk index, rebuilding it only when the corpus changes.
 
-def build_retriever(db: Session) -> Retriever:
-    """Load chunks from the database and construct a FAISS-backed retriever."""
+    Each call costs one aggregate query. On a change the index is read from
+    ``FAISS_CACHE_DIR`` when a copy for the same corpus exists, so a restarted
+    worker skips both the embedding read and the HNSW build.
+    """
 
-    chunks = ensure_embeddings(db)
-    if not chunks:
-        return _empty_retriever()
-    return Retriever(chunks)
+    global _cached_index
 
+    fingerprint = _corpus_fingerprint(db)
+    with _index_lock:
+        if _cached_index is None or _cached_index[0] != fingerprint:
+            _cached_index = _load_or_build_index(db, fingerprint)
+        return _cached_index[1]
@@ -4,9 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable, Sequence
 
-from pydantic import AnyUrl
-
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from app.models import Resource
@@ -23,7 +21,7 @@ def create_resource(
     *,
     title: str,
     description: str,
-    url: str | AnyUrl,
+    url: str,
     difficulty: str,
 ) -> Resource:
     """Persist a new resource entry."""
@@ -31,22 +29,25 @@ def create_resource(
     record = Resource(
         title=title,
         description=description,
-        url=str(url),
+        url=url,
         difficulty=difficulty,
     )
     db.add(record)
     db.commit()
-    db.refresh(record)
     return record
 
 
 def seed_resources(db: Session, resources: Iterable[dict[str, str]]) -> None:
     """Populate initial demo resources if the table is empty."""
 
-    if db.execute(select(Resource).limit(1)).scalar_one_or_none():
+    if db.execute(select(Resource.id).limit(1)).first() is not None:
         return
 
-    for entry in resources:
-        db.add(Resource(**entry))
+    entries = list(resources)
+    if not entries:
+        return
+    # One Core INSERT; ``insertmanyvalues`` sends the rows as batched VALUES
+    # lists without building ORM instances.
+    db.execute(insert(Resource), entries)
     db.commit()
 
@@ -0,0 +1,42 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models import AgentRun
+from app.services.agent import get_agent_history
+
+
+def test_history_pages_through_runs_sharing_a_timestamp():
+    engine = create_engine("sqlite://")
+    AgentRun.__table__.create(engine)
+    stamp = datetime(2025, 12, 1, 9, 0, 0)
+    with Session(engine) as db:
+        db.add_all(
+            AgentRun(
+                feature_slug="launch",
+                audience_role="Instructor",
+                audience_experience="intermediate",
+                summary=f"run {index}",
+                recommended_actions=[],
+                tool_calls=[],
+                created_at=stamp,
+            )
+            for index in range(5)
+        )
+        db.commit()
+
+        seen: list[int] = []
+        page = get_agent_history(db, limit=2)
+        while page:
+            seen.extend(run.id for run in page)
+            last = page[-1]
+            page = get_agent_history(db, limit=2, before=last.created_at, before_id=last.id)
+
+    assert seen == [5, 4, 3, 2, 1]
@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import agent
+from app.services.agent import AgentRecommendation, _GeminiCircuit, _parse_insight_line, _stream_lines
+
+
+def test_stream_lines_rejoins_lines_split_across_chunks():
+    chunks = [SimpleNamespace(text=part) for part in ("INSIGHT: Ready", " to ship\nRECOMM", "ENDATION_1: a|b|high")]
+
+    assert list(_stream_lines(chunks)) == ["INSIGHT: Ready to ship", "RECOMMENDATION_1: a|b|high"]
+
+
+def test_parse_insight_line_handles_insight_and_recommendations():
+    assert _parse_insight_line("INSIGHT:  Looks good ") == "Looks good"
+    assert _parse_insight_line("RECOMMENDATION_2: Drill|Run a rollback|urgent") == AgentRecommendation(
+        title="[AI] Drill", detail="Run a rollback", priority="medium"
+    )
+    assert _parse_insight_line("Some preamble") is None
+
+
+def test_gemini_circuit_opens_after_consecutive_failures_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(agent.time, "monotonic", lambda: now[0])
+    circuit = _GeminiCircuit(threshold=3, window_seconds=60, cooldown_seconds=30)
+
+    circuit.record_failure()
+    circuit.record_failure()
+    assert not circuit.is_open()
+    circuit.record_failure()
+    assert circuit.is_open()
+
+    now[0] += 31
+    assert not circuit.is_open()
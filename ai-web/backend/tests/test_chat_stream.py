@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.routers import chat as chat_router
+from app.services import chatbot
+from app.services.chatbot import ChatStreamInterrupted, ChatTurn
+
+
+class _FailingModel:
+    def generate_content(self, prompt, stream=False):
+        yield SimpleNamespace(text="Partial ")
+        raise ConnectionError("stream reset")
+
+
+@pytest.fixture
+def failing_gemini(monkeypatch):
+    monkeypatch.setattr(chatbot, "genai", object())
+    monkeypatch.setattr(chatbot, "get_settings", lambda: SimpleNamespace(gemini_api_key="key"))
+    monkeypatch.setattr(chatbot.gemini, "get_model", lambda api_key, name: _FailingModel())
+
+
+def test_mid_stream_failure_raises_instead_of_appending_text(failing_gemini):
+    turn = ChatTurn(prompt="mid-stream failure prompt", contexts=[], steps=[])
+    stream = chatbot.stream_chat_answer(turn)
+
+    assert next(stream) == ("Partial ", True)
+    with pytest.raises(ChatStreamInterrupted):
+        next(stream)
+
+
+def test_chat_events_emit_error_frame_before_done(failing_gemini):
+    turn = ChatTurn(prompt="mid-stream failure frames", contexts=[], steps=[])
+
+    frames = list(chat_router._chat_events(turn))
+
+    assert frames[0] == b'data: {"delta":"Partial "}\n\n'
+    assert frames[1].startswith(b'data: {"error":"Gemini stopped mid-answer')
+    assert b'"done":true' in frames[2]
@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.rag import ChunkIndex, embed_text, load_chunk_index
+
+
+def test_chunk_index_round_trips_through_disk(tmp_path):
+    texts = ["release checklist", "rollback drill", "feature brief"]
+    original = ChunkIndex([11, 12, 13], np.stack([embed_text(text) for text in texts]))
+    path = str(tmp_path / "chunks")
+
+    original.write(path)
+    restored = ChunkIndex.read(path)
+
+    query = np.expand_dims(embed_text("rollback"), axis=0)
+    assert restored.ids.tolist() == [11, 12, 13]
+    assert restored.index.search(query, 1)[1].tolist() == original.index.search(query, 1)[1].tolist()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+class _CountingSession:
+    """Minimal stand-in that returns ``rows`` for every query and counts round-trips."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+        self.commits = 0
+
+    def execute(self, _statement, _params=None):
+        self.calls += 1
+        return self
+
+    def all(self):
+        return self.rows
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_chunk_index_caches_results_per_query_and_k():
+    chunk_index = ChunkIndex([1, 2], np.stack([embed_text("release checklist"), embed_text("rollback drill")]))
+    row = SimpleNamespace(id=2, content="rollback drill", source="runbook.md")
+    db = _CountingSession([row])
+
+    first = chunk_index.search(db, "rollback", k=1)
+    second = chunk_index.search(db, "rollback", k=1)
+    chunk_index.search(db, "rollback", k=2)
+
+    assert [context.source for context in first] == ["runbook.md"]
+    assert second == first
+    assert db.calls == 2
+
+
+def test_embed_text_is_stable_across_hash_seeds():
+    script = "from app.services.rag import embed_text; print(embed_text('rollback drill').nonzero()[0].tolist())"
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=BACKEND_DIR,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+
+    assert len(outputs) == 1
+
+
+def test_chunk_index_search_batch_matches_single_queries():
+    texts = ["release checklist", "rollback drill"]
+    chunk_index = ChunkIndex([1, 2], np.stack([embed_text(text) for text in texts]))
+    rows = [
+        SimpleNamespace(id=1, content="release checklist", source="checklist.md"),
+        SimpleNamespace(id=2, content="rollback drill", source="runbook.md"),
+    ]
+    db = _CountingSession(rows)
+
+    batched = chunk_index.search_batch(db, ["rollback", "checklist"], k=1)
+
+    assert db.calls == 1
+    assert [[context.source for context in contexts] for contexts in batched] == [["runbook.md"], ["checklist.md"]]
+    assert chunk_index.search(db, "rollback", k=1) == batched[0]
+    assert db.calls == 1
+
+
+def test_load_chunk_index_embeds_missing_rows_in_the_same_pass():
+    stored = "[" + ",".join(str(value) for value in embed_text("release checklist").tolist()) + "]"
+    db = _CountingSession(
+        [
+            SimpleNamespace(id=1, embedding=stored, content=None),
+            SimpleNamespace(id=2, embedding=None, content="rollback drill"),
+        ]
+    )
+
+    chunk_index = load_chunk_index(db)
+
+    query = np.expand_dims(embed_text("rollback drill"), axis=0)
+    assert chunk_index.ids.tolist() == [1, 2]
+    assert chunk_index.index.search(query, 1)[1].tolist() == [[1]]
+    assert (db.calls, db.commits) == (2, 1)  # One projection, one bulk UPDATE.
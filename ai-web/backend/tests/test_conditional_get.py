@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import agent
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(agent.router)
+    return TestClient(app)
+
+
+def test_features_returns_etag_and_body():
+    response = _client().get("/ai/features")
+
+    assert response.status_code == 200
+    assert response.headers["etag"]
+    assert response.json()["total"] == len(response.json()["features"])
+
+
+def test_features_returns_304_when_etag_matches():
+    client = _client()
+    etag = client.get("/ai/features").headers["etag"]
+
+    response = client.get("/ai/features", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services.echo import get_flaky_echo_payload
+
+
+class _NoWriteSession:
+    def execute(self, *args, **kwargs):
+        raise AssertionError("failures=0 must not touch the database")
+
+    def commit(self):
+        raise AssertionError("failures=0 must not touch the database")
+
+
+def test_zero_failures_succeeds_without_writing_a_counter_row():
+    payload = get_flaky_echo_payload("hello", "127.0.0.1", 0, _NoWriteSession())
+
+    assert payload == {"msg": "hello", "attempts": 1}
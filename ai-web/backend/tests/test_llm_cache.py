@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import llm_cache
+from app.services.llm_cache import LLMCache
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = LLMCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", "first")
+    cache.set("b", "second")
+    assert cache.get("a") == "first"  # Touch "a" so "b" becomes the oldest entry.
+
+    cache.set("c", "third")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now[0])
+    cache = LLMCache(maxsize=4, ttl_seconds=10)
+    cache.set(LLMCache.key("model", "prompt"), "answer")
+
+    now[0] += 11
+
+    assert cache.get(LLMCache.key("model", "prompt")) is None
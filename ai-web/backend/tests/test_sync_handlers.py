@@ -0,0 +1,29 @@
+import inspect
+import sys
+from pathlib import Path
+
+from fastapi.routing import APIRoute
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.database import get_db
+from app.routers import agent, chat, echo, gemini, planner, resources
+
+
+def _uses_db_session(route: APIRoute) -> bool:
+    return any(dependency.call is get_db for dependency in route.dependant.dependencies)
+
+
+def test_handlers_with_sync_sessions_are_not_coroutines():
+    offenders = [
+        f"{module.__name__}:{route.endpoint.__name__}"
+        for module in (agent, chat, echo, gemini, planner, resources)
+        for route in module.router.routes
+        if isinstance(route, APIRoute)
+        and _uses_db_session(route)
+        and inspect.iscoroutinefunction(route.endpoint)
+    ]
+
+    assert offenders == []
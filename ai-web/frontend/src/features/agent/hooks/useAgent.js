@@ -1,6 +1,6 @@
 import { useCallback, useEffect, useState } from 'react';
 
-import { get, post } from '../../../lib/api';
+import { get, postStream } from '../../../lib/api';
 
 /**
  * Hook for managing the release readiness agent state.
@@ -68,14 +68,14 @@ export function useAgent() {
     setResult(null);
 
     try {
-      const response = await post('/ai/release-readiness', {
+      // Each frame is a complete snapshot, so render it as soon as it arrives.
+      await postStream('/ai/release-readiness/stream', {
         feature_slug: selectedFeature,
         launch_date: launchDate,
         audience_role: audienceRole,
         audience_experience: audienceExperience,
         include_risks: includeRisks,
-      });
-      setResult(response);
+      }, (event) => setResult(event.result));
       loadHistory(); // Refresh history after running
     } catch (err) {
       console.error('Agent request failed', err);
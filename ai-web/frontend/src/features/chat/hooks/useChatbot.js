@@ -1,6 +1,6 @@
 import { useCallback, useState } from 'react';
 
-import { post } from '../../../lib/api';
+import { postStream } from '../../../lib/api';
 
 export function useChatbot() {
   const [messages, setMessages] = useState([]);
@@ -16,10 +16,27 @@ export function useChatbot() {
     setError('');
     setMessages((prev) => [...prev, { role: 'user', text: question }]);
     try {
-      const result = await post('/chat/', { message: question });
-      setMessages((prev) => [...prev, { role: 'assistant', text: result.answer }]);
-      setContexts(result.contexts || []);
-      setSteps(result.steps || []);
+      let answer = '';
+      await postStream('/chat/stream', { message: question }, (event) => {
+        if (event.done) {
+          setContexts(event.contexts || []);
+          setSteps(event.steps || []);
+          return;
+        }
+        if (event.error) {
+          // The partial answer stays visible; flag that it was cut short.
+          setError(event.error);
+          return;
+        }
+        const first = answer === '';
+        answer += event.delta || '';
+        // Render the reply as tokens arrive: append on the first delta, then grow it in place.
+        setMessages((prev) =>
+          first
+            ? [...prev, { role: 'assistant', text: answer }]
+            : [...prev.slice(0, -1), { role: 'assistant', text: answer }]
+        );
+      });
     } catch (err) {
       console.error('Chat request failed', err);
       setError(err.message || 'Unable to reach chatbot');
@@ -19,42 +19,94 @@ export async function post(path, body) {
     body: JSON.stringify(body)
   });
   if (!res.ok) {
-    // Propagate a descriptive error so callers can surface the failure in the UI.
-    let message = `HTTP ${res.status}`;
-    let detail;
-    const contentType = res.headers.get('content-type') || '';
+    throw await toError(res);
+  }
+  return res.json();
+}
 
-    try {
-      if (contentType.includes('application/json')) {
-        const data = await res.json();
-        detail = typeof data?.detail === 'string'
-          ? data.detail
-          : Array.isArray(data?.detail)
-            ? data.detail.map((item) => item?.msg).filter(Boolean).join('; ')
-            : undefined;
-        if (!detail && typeof data?.message === 'string') {
-          detail = data.message;
-        }
-      } else {
-        const text = await res.text();
-        detail = text.trim() || undefined;
+/**
+ * POST JSON and consume a server-sent event stream from the backend.
+ *
+ * @param {string} path - Relative API path such as "/chat/stream".
+ * @param {Record<string, unknown>} body - Serializable payload to send.
+ * @param {(event: any) => void} onEvent - Called with each parsed `data:` frame.
+ * @returns {Promise<void>} Resolves once the stream closes.
+ * @throws {Error} When the HTTP response is not in the 200 range.
+ */
+export async function postStream(path, body, onEvent) {
+  const res = await fetch(`${BASE}${path}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body)
+  });
+  if (!res.ok) {
+    throw await toError(res);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    // Frames are separated by a blank line; keep any partial frame for the next read.
+    const frames = buffer.split('\n\n');
+    buffer = frames.pop();
+    for (const frame of frames) {
+      const data = frame
+        .split('\n')
+        .filter((line) => line.startsWith('data:'))
+        .map((line) => line.slice(5).trimStart())
+        .join('\n');
+      if (data) {
+        onEvent(JSON.parse(data));
       }
-    } catch (parseError) {
-      // Ignore body parsing errors; fall back to the default message.
     }
+  }
+}
 
-    if (detail) {
-      message = detail;
-    }
+/**
+ * Build a descriptive Error from a non-2xx response.
+ *
+ * @param {Response} res - Failed fetch response.
+ * @returns {Promise<Error>} Error carrying `status` and, when available, `detail`.
+ */
+async function toError(res) {
+  // Propagate a descriptive error so callers can surface the failure in the UI.
+  let message = `HTTP ${res.status}`;
+  let detail;
+  const contentType = res.headers.get('content-type') || '';
 
-    const error = new Error(message);
-    error.status = res.status;
-    if (detail) {
-      error.detail = detail;
+  try {
+    if (contentType.includes('application/json')) {
+      const data = await res.json();
+      detail = typeof data?.detail === 'string'
+        ? data.detail
+        : Array.isArray(data?.detail)
+          ? data.detail.map((item) => item?.msg).filter(Boolean).join('; ')
+          : undefined;
+      if (!detail && typeof data?.message === 'string') {
+        detail = data.message;
+      }
+    } else {
+      const text = await res.text();
+      detail = text.trim() || undefined;
     }
-    throw error;
+  } catch (parseError) {
+    // Ignore body parsing errors; fall back to the default message.
   }
-  return res.json();
+
+  if (detail) {
+    message = detail;
+  }
+
+  const error = new Error(message);
+  error.status = res.status;
+  if (detail) {
+    error.detail = detail;
+  }
+  return error;
 }
 
 export async function get(path) {
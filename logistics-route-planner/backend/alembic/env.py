@@ -7,7 +7,7 @@ from logging.config import fileConfig
 
 from dotenv import load_dotenv
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config
 
 from app.database import Base
 from app.models import *  # noqa: F401,F403
@@ -46,7 +46,7 @@ def run_migrations_online() -> None:
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        pool_pre_ping=True,
     )
 
     with connectable.connect() as connection:
@@ -0,0 +1,59 @@
+"""Store chunk embeddings as pgvector vectors and index the history queries.
+
+Revision ID: 20251221_pgvector_embeddings
+Revises: 20251220_initial
+Create Date: 2025-12-21
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20251221_pgvector_embeddings"
+down_revision: Union[str, None] = "20251220_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBED_DIM = 384
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    # Anything that is not a full-size array cannot be cast; it is re-embedded
+    # on the next retrieval instead.
+    op.execute(
+        "UPDATE document_chunks SET embedding = NULL "
+        f"WHERE jsonb_typeof(embedding) <> 'array' OR jsonb_array_length(embedding) <> {EMBED_DIM}"
+    )
+    op.execute(
+        f"ALTER TABLE document_chunks ALTER COLUMN embedding TYPE vector({EMBED_DIM}) "
+        "USING embedding::text::vector"
+    )
+    op.create_index(
+        "ix_document_chunks_embedding_hnsw",
+        "document_chunks",
+        ["embedding"],
+        postgresql_using="hnsw",
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
+
+    op.create_index("ix_route_runs_created_desc", "route_runs", [sa.text("created_at DESC")])
+    op.create_index("ix_agent_runs_created_desc", "agent_runs", [sa.text("created_at DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agent_runs_created_desc", table_name="agent_runs")
+    op.drop_index("ix_route_runs_created_desc", table_name="route_runs")
+    op.drop_index("ix_document_chunks_embedding_hnsw", table_name="document_chunks")
+    op.alter_column(
+        "document_chunks",
+        "embedding",
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using="embedding::text::jsonb",
+    )
@@ -0,0 +1,56 @@
+"""Rebuild the chunk HNSW index over half-precision vectors.
+
+Revision ID: 20251222_halfvec_hnsw
+Revises: 20251221_pgvector_embeddings
+Create Date: 2025-12-22
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251222_halfvec_hnsw"
+down_revision: Union[str, None] = "20251221_pgvector_embeddings"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBED_DIM = 384
+
+
+def upgrade() -> None:
+    # halfvec needs pgvector >= 0.7; the stored column keeps full precision.
+    # CONCURRENTLY avoids blocking ingestion but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_document_chunks_embedding_half_hnsw",
+            "document_chunks",
+            [sa.text(f"(embedding::halfvec({EMBED_DIM})) halfvec_cosine_ops")],
+            postgresql_using="hnsw",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_document_chunks_embedding_hnsw",
+            table_name="document_chunks",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_document_chunks_embedding_hnsw",
+            "document_chunks",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_document_chunks_embedding_half_hnsw",
+            table_name="document_chunks",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,50 @@
+"""Add the unique index that backs the echo attempt upsert.
+
+Revision ID: 20251223_echo_attempt_upsert
+Revises: 20251222_halfvec_hnsw
+Create Date: 2025-12-23
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20251223_echo_attempt_upsert"
+down_revision: Union[str, None] = "20251222_halfvec_hnsw"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Racing first calls may have created duplicate counter rows; keep the newest.
+    op.execute(
+        """
+        DELETE FROM echo_attempts AS older
+        USING echo_attempts AS newer
+        WHERE older.client_key = newer.client_key
+          AND md5(older.message) = md5(newer.message)
+          AND older.id < newer.id
+        """
+    )
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_echo_attempts_client_message",
+            "echo_attempts",
+            ["client_key", sa.text("md5(message)")],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ux_echo_attempts_client_message",
+            table_name="echo_attempts",
+            postgresql_concurrently=True,
+        )
@@ -8,6 +8,7 @@ application can rely on typed settings rather than scattered calls to
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 
 class Settings:
@@ -19,6 +20,25 @@ class Settings:
     groq_api_key: str | None
     mapbox_api_key: str | None
     google_maps_api_key: str | None
+    run_create_all: bool
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    pool_timeout: int
+    use_null_pool: bool
+    semantic_cache_size: int
+    semantic_cache_ttl: float
+    semantic_cache_threshold: float
+    agent_max_concurrency: int
+    agent_batch_max_size: int
+    threadpool_size: int
+    tool_pool_size: int
+    geocode_fanout: int
+    llm_cache_size: int
+    llm_cache_ttl: float
+    geocode_cache_size: int
+    geocode_cache_ttl: float
 
     def __init__(self) -> None:
         self.database_url = os.getenv(
@@ -30,14 +50,49 @@ class Settings:
         self.groq_api_key = os.getenv("GROQ_API_KEY")
         self.mapbox_api_key = os.getenv("MAPBOX_API_KEY")
         self.google_maps_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+        # Alembic owns the schema; only opt into ``create_all`` for throwaway
+        # local databases that skip migrations.
+        self.run_create_all = os.getenv("RUN_CREATE_ALL", "0") == "1"
+        # Connection pool tuning so concurrent sync endpoints do not queue on
+        # SQLAlchemy's default five-connection pool. The limits apply per
+        # worker process, so divide them by the worker count.
+        self.pool_size = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+        self.pool_recycle = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+        self.pool_pre_ping = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+        self.pool_timeout = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        # Behind PgBouncer in transaction mode, let it do the pooling instead.
+        self.use_null_pool = os.getenv("DB_NULL_POOL", "0") == "1"
+        # Reuse /ai/search results for near-identical queries (cosine >= the
+        # threshold); set SEMANTIC_CACHE_SIZE=0 to disable.
+        self.semantic_cache_size = int(os.getenv("SEMANTIC_CACHE_SIZE", "256"))
+        self.semantic_cache_ttl = float(os.getenv("SEMANTIC_CACHE_TTL", "300"))
+        self.semantic_cache_threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+        # Batch endpoints run at most this many agent calls at once (each holds
+        # a DB connection and an LLM request) and reject larger payloads.
+        self.agent_max_concurrency = int(os.getenv("AGENT_MAX_CONCURRENCY", "4"))
+        self.agent_batch_max_size = int(os.getenv("AGENT_BATCH_MAX_SIZE", "25"))
+        # Sync endpoints run on AnyIO's worker threads (40 by default); chat and
+        # route validation spend most of that time waiting on LLM and tool HTTP
+        # calls, so size the limiter well above the connection pool.
+        self.threadpool_size = int(os.getenv("THREADPOOL_SIZE", "100"))
+        # Route validation overlaps its tool and reverse-geocoding calls on one
+        # process-wide pool; each request spreads its stops over at most
+        # GEOCODE_FANOUT jobs so a long route cannot take every worker.
+        self.tool_pool_size = int(os.getenv("TOOL_POOL_SIZE", "16"))
+        self.geocode_fanout = int(os.getenv("GEOCODE_FANOUT", "2"))
+        # Reuse LLM answers for identical prompts and chat questions; set
+        # LLM_CACHE_SIZE=0 to disable. The TTL also bounds how stale cached
+        # chat answers built from live weather/traffic tools can get.
+        self.llm_cache_size = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+        self.llm_cache_ttl = float(os.getenv("LLM_CACHE_TTL", "600"))
+        # MapBox bills per reverse-geocoding call; place names for a point
+        # practically never change, so cache them for a day.
+        self.geocode_cache_size = int(os.getenv("GEOCODE_CACHE_SIZE", "50000"))
+        self.geocode_cache_ttl = float(os.getenv("GEOCODE_CACHE_TTL", "86400"))
 
 
-# Create a single instance that will be imported everywhere
-_settings = None
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return the Settings instance used across the app."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Return the cached ``Settings`` instance used across the app."""
+    return Settings()
@@ -9,8 +9,13 @@ env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
 # Now import everything else
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
 from app.database import Base, engine
@@ -22,12 +27,24 @@ from app.routers.geocoding import router as geocoding_router
 from app.routers.planner import router as planner_router
 
 settings = get_settings()
-Base.metadata.create_all(bind=engine)
+if settings.run_create_all:
+    Base.metadata.create_all(bind=engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the worker pool that runs the sync, I/O-bound agent endpoints."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    yield
+
 
 app = FastAPI(
     title="Logistics Route Planner Launch Assistant",
     description="AI-powered logistics route planning with Gemini and RAG",
     version="1.0.0",
+    # orjson encodes straight to bytes, well ahead of the stdlib encoder.
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -5,12 +5,19 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import DDL, Boolean, DateTime, Index, Integer, String, Text, cast, event, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
+# Output size of the all-MiniLM-L6-v2 SentenceTransformer used by ``app.services.rag``.
+EMBED_DIM = 384
+
+# ``create_all`` at startup needs the extension before it can create vector columns.
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS vector"))
+
 
 def utcnow() -> datetime:
     """Return a timezone-naive UTC timestamp for created_at columns."""
@@ -30,6 +37,16 @@ class EchoAttempt(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 
+# ``/echo`` upserts one counter row per (client, message). Hashing the message
+# keeps long payloads under the btree entry size limit.
+Index(
+    "ux_echo_attempts_client_message",
+    EchoAttempt.client_key,
+    func.md5(EchoAttempt.message),
+    unique=True,
+)
+
+
 class RouteRun(Base):
     """Persist generated route plans so users can inspect prior results."""
 
@@ -46,6 +63,10 @@ class RouteRun(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 
+# The history endpoints read ``ORDER BY created_at DESC LIMIT n``.
+Index("ix_route_runs_created_desc", RouteRun.created_at.desc())
+
+
 class DocumentChunk(Base):
     """Indexed content used by the retrieval-augmented agent."""
 
@@ -55,10 +76,21 @@ class DocumentChunk(Base):
     slug: Mapped[str] = mapped_column(String(120), index=True)
     source: Mapped[str] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text)
-    embedding: Mapped[list[float]] = mapped_column(JSONB, nullable=True)
+    embedding: Mapped[Any] = mapped_column(Vector(EMBED_DIM), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 
+# The HNSW graph is built over half-precision copies of the stored vectors,
+# halving index memory; queries must order by this exact expression to use it.
+EMBEDDING_HALF = cast(DocumentChunk.embedding, HALFVEC(EMBED_DIM))
+Index(
+    "ix_document_chunks_embedding_half_hnsw",
+    EMBEDDING_HALF.label("embedding_half"),
+    postgresql_using="hnsw",
+    postgresql_ops={"embedding_half": "halfvec_cosine_ops"},
+)
+
+
 class AgentRun(Base):
     """Persist agent execution history for auditing and learning from past runs."""
 
@@ -75,3 +107,6 @@ class AgentRun(Base):
     rag_contexts: Mapped[Any] = mapped_column(JSONB, default=list)
     used_gemini: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+
+
+Index("ix_agent_runs_created_desc", AgentRun.created_at.desc())
@@ -9,15 +9,19 @@ This router uses LangChain-based agent implementation with:
 
 from __future__ import annotations
 
+import json
 import os
-from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import get_db
-from app.services.rag import build_retriever
+from app.services.batch import run_batch
+from app.services.rag import build_retriever, embed_text
+from app.services.semantic_cache import search_cache
 from app.schemas.route_planning import RouteRequest, RouteValidationResult
 
 # Use LangChain agent by default
@@ -39,6 +43,35 @@ else:
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
+# The sample routes never change, so the response body is encoded once.
+_EXAMPLE_ROUTES = [
+    {
+        "route_id": "RT-001",
+        "name": "Downtown Morning Delivery",
+        "start_location": "San Francisco Depot",
+        "planned_start_time": "2025-12-24T07:00:00Z",
+        "num_stops": 8,
+        "description": "High-priority deliveries in downtown SF during morning hours"
+    },
+    {
+        "route_id": "RT-002",
+        "name": "Suburban Afternoon Route",
+        "start_location": "Oakland Warehouse",
+        "planned_start_time": "2025-12-24T13:00:00Z",
+        "num_stops": 12,
+        "description": "Standard deliveries in suburban areas with flexible time windows"
+    },
+    {
+        "route_id": "RT-003",
+        "name": "Express Cross-City",
+        "start_location": "San Jose Distribution Center",
+        "planned_start_time": "2025-12-24T10:00:00Z",
+        "num_stops": 5,
+        "description": "Urgent deliveries across multiple cities"
+    }
+]
+_ROUTES_BODY = json.dumps({"routes": _EXAMPLE_ROUTES, "total": len(_EXAMPLE_ROUTES)}).encode("utf-8")
+
 
 class AgentHistoryItem(BaseModel):
     """Simplified view of a historical agent run."""
@@ -82,12 +115,37 @@ def validate_route(
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+class RouteValidationBatchItem(BaseModel):
+    """Outcome of one route in a batch; ``error`` is set when validation failed."""
+
+    result: RouteValidationResult | None = None
+    error: str | None = None
+
+
+@router.post("/validate-route/batch", response_model=list[RouteValidationBatchItem])
+def validate_route_batch(payload: list[RouteRequest]) -> list[RouteValidationBatchItem]:
+    """Validate several routes concurrently, returning outcomes in request order.
+
+    Each route runs with its own database session; a failing route does not
+    fail the rest of the batch.
+    """
+    settings = get_settings()
+    if len(payload) > settings.agent_batch_max_size:
+        raise HTTPException(
+            status_code=400, detail=f"Batch size cannot exceed {settings.agent_batch_max_size} routes"
+        )
+    outcomes = run_batch(
+        lambda route, db: run_route_validation_agent(route, db=db), payload, settings.agent_max_concurrency
+    )
+    return [RouteValidationBatchItem(result=item.value, error=item.error) for item in outcomes]
+
+
 @router.get("/history", response_model=AgentHistoryResponse)
 def agent_history(
     route_slug: str | None = Query(None, description="Filter by route slug"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of runs to return"),
     db: Session = Depends(get_db),
-) -> AgentHistoryResponse:
+) -> ORJSONResponse:
     """Retrieve historical agent runs from the database.
 
     This endpoint allows reviewing past agent executions for:
@@ -95,57 +153,32 @@ def agent_history(
     - Learning from previous recommendations
     - Analyzing patterns in route readiness assessments
     """
+    # The rows already match AgentHistoryItem, so skip building a model per run
+    # and let orjson encode the plain dicts; response_model still documents it.
     runs = get_agent_history(db, route_slug=route_slug, limit=limit)
     items = [
-        AgentHistoryItem(
-            id=run.id,
-            route_slug=run.route_slug,
-            audience_role=run.audience_role,
-            summary=run.summary,
-            gemini_insight=run.gemini_insight,
-            used_gemini=run.used_gemini,
-            created_at=run.created_at.isoformat(),
-        )
+        {
+            "id": run.id,
+            "route_slug": run.route_slug,
+            "audience_role": run.audience_role,
+            "summary": run.summary,
+            "gemini_insight": run.gemini_insight,
+            "used_gemini": run.used_gemini,
+            "created_at": run.created_at.isoformat(),
+        }
         for run in runs
     ]
-    return AgentHistoryResponse(runs=items, total=len(items))
+    return ORJSONResponse({"runs": items, "total": len(items)})
 
 
 @router.get("/routes")
-def list_available_routes() -> dict[str, Any]:
+def list_available_routes() -> Response:
     """List example routes for testing the validation system.
 
     This endpoint provides sample RouteRequest examples that
     can be used to test the route validation agent.
     """
-    examples = [
-        {
-            "route_id": "RT-001",
-            "name": "Downtown Morning Delivery",
-            "start_location": "San Francisco Depot",
-            "planned_start_time": "2025-12-24T07:00:00Z",
-            "num_stops": 8,
-            "description": "High-priority deliveries in downtown SF during morning hours"
-        },
-        {
-            "route_id": "RT-002",
-            "name": "Suburban Afternoon Route",
-            "start_location": "Oakland Warehouse",
-            "planned_start_time": "2025-12-24T13:00:00Z",
-            "num_stops": 12,
-            "description": "Standard deliveries in suburban areas with flexible time windows"
-        },
-        {
-            "route_id": "RT-003",
-            "name": "Express Cross-City",
-            "start_location": "San Jose Distribution Center",
-            "planned_start_time": "2025-12-24T10:00:00Z",
-            "num_stops": 5,
-            "description": "Urgent deliveries across multiple cities"
-        }
-    ]
-
-    return {"routes": examples, "total": len(examples)}
+    return Response(content=_ROUTES_BODY, media_type="application/json")
 
 
 class SearchResult(BaseModel):
@@ -166,6 +199,9 @@ class SearchResponse(BaseModel):
 def search_documents(
     query: str = Query(..., description="Search query for semantic retrieval"),
     k: int = Query(5, ge=1, le=20, description="Number of results to return"),
+    ef_search: int | None = Query(
+        None, ge=1, le=1000, description="HNSW candidate list size; higher trades latency for recall"
+    ),
     db: Session = Depends(get_db),
 ) -> SearchResponse:
     """Search the knowledge base using semantic similarity.
@@ -176,8 +212,13 @@ def search_documents(
     if not query.strip():
         raise HTTPException(status_code=400, detail="Query cannot be empty")
     
-    retriever = build_retriever(db)
-    docs = retriever.search(query, k=k)
+    # Near-duplicate queries reuse earlier results and skip the database entirely.
+    # Explicit ef_search requests are recall probes, so they always hit the index.
+    query_vector = embed_text(query)
+    if ef_search is not None:
+        docs = build_retriever(db).search_vector(query_vector, k=k, ef_search=ef_search)
+    elif (docs := search_cache.lookup(query_vector, k)) is None:
+        docs = search_cache.put(query_vector, k, build_retriever(db).search_vector(query_vector, k=k))
     
     results = [
         SearchResult(
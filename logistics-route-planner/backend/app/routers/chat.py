@@ -12,23 +12,11 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import get_db
+from app.services.batch import run_batch
 from app.services.chat_agent import run_chat_agent
 
-# LLM imports
-try:
-    from langchain_google_genai import ChatGoogleGenerativeAI
-except ImportError:
-    ChatGoogleGenerativeAI = None
-
-try:
-    from langchain_openai import ChatOpenAI
-except ImportError:
-    ChatOpenAI = None
-
-import os
-from app.config import get_settings
-
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
@@ -52,28 +40,18 @@ class ChatResponse(BaseModel):
     rag_contexts: list[dict[str, Any]] = []
 
 
-def _get_llm():
-    """Get the configured LLM (Gemini or Groq)."""
-    settings = get_settings()
-    
-    # Try Gemini first
-    if settings.gemini_api_key and ChatGoogleGenerativeAI:
-        return ChatGoogleGenerativeAI(
-            model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
-            google_api_key=settings.gemini_api_key,
-            temperature=0.7,
-        )
-    
-    # Try Groq (via OpenAI-compatible API)
-    if settings.groq_api_key and ChatOpenAI:
-        return ChatOpenAI(
-            base_url="https://api.groq.com/openai/v1",
-            api_key=settings.groq_api_key,
-            model=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
-            temperature=0.7,
-        )
-    
-    raise RuntimeError("No LLM configured. Set GEMINI_API_KEY or GROQ_API_KEY")
+class ChatBatchItem(BaseModel):
+    """Outcome of one question in a batch; ``error`` is set when the agent failed."""
+    response: ChatResponse | None = None
+    error: str | None = None
+
+
+def _chat_response(result: Any) -> ChatResponse:
+    return ChatResponse(
+        answer=result.answer,
+        tool_calls=[tc.model_dump() for tc in result.tool_calls],
+        rag_contexts=[rc.model_dump() for rc in result.rag_contexts]
+    )
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -98,13 +76,24 @@ def chat(message: ChatMessage, db: Session = Depends(get_db)) -> ChatResponse:
     - "How do I handle time windows?"
     """
     try:
-        result = run_chat_agent(message.question, db)
-        return ChatResponse(
-            answer=result.answer,
-            tool_calls=[tc.model_dump() for tc in result.tool_calls],
-            rag_contexts=[rc.model_dump() for rc in result.rag_contexts]
-        )
+        return _chat_response(run_chat_agent(message.question, db))
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat agent error: {str(e)}")
+
+
+@router.post("/chat/batch", response_model=list[ChatBatchItem])
+def chat_batch(messages: list[ChatMessage]) -> list[ChatBatchItem]:
+    """Answer several questions concurrently, returning outcomes in request order."""
+    settings = get_settings()
+    if len(messages) > settings.agent_batch_max_size:
+        raise HTTPException(
+            status_code=400, detail=f"Batch size cannot exceed {settings.agent_batch_max_size} questions"
+        )
+    outcomes = run_batch(
+        lambda message, db: _chat_response(run_chat_agent(message.question, db)),
+        messages,
+        settings.agent_max_concurrency,
+    )
+    return [ChatBatchItem(response=item.value, error=item.error) for item in outcomes]
@@ -7,6 +7,8 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -39,28 +41,22 @@ def echo(payload: EchoIn, db: Session = Depends(get_db)) -> EchoOut:
     """
     client_key = payload.client_key or "anonymous"
 
-    # Find or create attempt record
-    attempt = db.query(EchoAttempt).filter(
-        EchoAttempt.client_key == client_key,
-        EchoAttempt.message == payload.message,
-    ).first()
-
-    if attempt is None:
-        # First attempt - decide how many failures to simulate
-        failures = random.randint(1, 3)
-        attempt = EchoAttempt(
-            client_key=client_key,
-            message=payload.message,
-            failures=failures,
-            attempts=1,
-        )
-        db.add(attempt)
-        db.commit()
-        db.refresh(attempt)
-    else:
-        attempt.attempts += 1
-        db.commit()
-        db.refresh(attempt)
+    # One round-trip: the first call decides how many failures to simulate,
+    # later calls bump the counter under the row lock instead of racing a
+    # SELECT-then-INSERT.
+    insert_stmt = insert(EchoAttempt).values(
+        client_key=client_key,
+        message=payload.message,
+        failures=random.randint(1, 3),
+        attempts=1,
+    )
+    attempt = db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[EchoAttempt.client_key, func.md5(EchoAttempt.message)],
+            set_={"attempts": EchoAttempt.attempts + 1},
+        ).returning(EchoAttempt.attempts, EchoAttempt.failures)
+    ).one()
+    db.commit()
 
     # Simulate failure if not enough attempts yet
     if attempt.attempts <= attempt.failures:
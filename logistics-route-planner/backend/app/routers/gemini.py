@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import os
-from typing import Any
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from app.config import get_settings
+from app.services.llm_cache import LLMCache, llm_cache
 
 router = APIRouter(prefix="/gemini", tags=["gemini"])
 
@@ -47,13 +49,17 @@ def generate_content(payload: GenerateRequest) -> GenerateResponse:
             detail="Gemini API not configured. Please set GEMINI_API_KEY environment variable.",
         )
 
+    model_name = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+    cache_key = LLMCache.key(model_name, payload.prompt)
+    if (content := llm_cache.get(cache_key)) is not None:
+        return GenerateResponse(content=content, model=model_name)
+
     try:
         genai.configure(api_key=settings.gemini_api_key)
-        model_name = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
         model = genai.GenerativeModel(model_name)
 
         response = model.generate_content(payload.prompt)
-        content = getattr(response, "text", "").strip()
+        content = llm_cache.set(cache_key, getattr(response, "text", "").strip())
 
         return GenerateResponse(content=content, model=model_name)
 
@@ -64,12 +70,18 @@ def generate_content(payload: GenerateRequest) -> GenerateResponse:
         ) from exc
 
 
-@router.get("/status")
-def gemini_status() -> dict[str, Any]:
-    """Check Gemini API configuration status."""
+@lru_cache(maxsize=1)
+def _status_body() -> bytes:
+    """Encode the status once; settings and the SDK import are fixed per process."""
     settings = get_settings()
-    return {
+    return json.dumps({
         "configured": bool(settings.gemini_api_key),
         "sdk_available": genai is not None,
         "model": os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
-    }
+    }).encode("utf-8")
+
+
+@router.get("/status")
+def gemini_status() -> Response:
+    """Check Gemini API configuration status."""
+    return Response(content=_status_body(), media_type="application/json")
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -34,17 +35,20 @@ def validate_route(payload: dict[str, Any]) -> RouteValidationResult:
 
 
 @router.get("/route/history", response_model=list[dict[str, Any]])
-def list_route_plans(db: Session = Depends(get_db)) -> list[dict[str, Any]]:
+def list_route_plans(db: Session = Depends(get_db)) -> ORJSONResponse:
     """Return recently generated route plans to demonstrate persistence."""
-    runs = db.execute(select(RouteRun).order_by(RouteRun.created_at.desc()).limit(10)).scalars().all()
-    return [
-        {
-            "id": run.id,
-            "goal": run.goal,
-            "audience_role": run.audience_role,
-            "audience_experience": run.audience_experience,
-            "summary": run.summary,
-            "plan": run.plan,
-        }
-        for run in runs
-    ]
+    runs = db.execute(
+        select(
+            RouteRun.id,
+            RouteRun.goal,
+            RouteRun.audience_role,
+            RouteRun.audience_experience,
+            RouteRun.summary,
+            RouteRun.plan,
+        )
+        .order_by(RouteRun.created_at.desc())
+        .limit(10)
+    ).all()
+    # Plain dicts straight to orjson; validating them against dict[str, Any]
+    # would only copy them.
+    return ORJSONResponse([run._asdict() for run in runs])
@@ -28,7 +28,7 @@ class RouteStep(BaseModel):
     @classmethod
     def _trim_criteria(cls, value: list[str]) -> list[str]:
         """Remove empty acceptance criteria entries."""
-        return [item.strip() for item in value if item.strip()]
+        return [stripped for item in value if (stripped := item.strip())]
 
 
 class RouteRequest(BaseModel):
@@ -53,11 +53,9 @@ class RoutePlan(BaseModel):
     @model_validator(mode="after")
     def _ensure_unique_titles(self) -> "RoutePlan":
         """Guarantee that step titles stay unique for accessible rendering."""
-        seen: set[str] = set()
-        for step in self.steps:
-            if step.title in seen:
-                raise ValueError("Step titles must be unique within a plan.")
-            seen.add(step.title)
+        titles = [step.title for step in self.steps]
+        if len(set(titles)) != len(titles):
+            raise ValueError("Step titles must be unique within a plan.")
         return self
 
 
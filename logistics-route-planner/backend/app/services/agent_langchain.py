@@ -10,16 +10,20 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Any
 
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models import AgentRun
 from app.schemas.route_planning import RouteRequest, RouteValidationResult
-from app.services.agent_tools import get_all_tools
+from app.services.agent_tools import get_all_tools, reverse_geocode_mapbox
 from app.services.rag import RetrievedContext, build_retriever
 
 # LLM imports
@@ -188,8 +192,13 @@ def _build_structured_action_plan(
     return [step for step in plan if step]
 
 
+@lru_cache(maxsize=1)
 def _get_llm():
-    """Get the configured LLM (Gemini or Groq via OpenAI compatibility)."""
+    """Get the configured LLM (Gemini or Groq via OpenAI compatibility).
+
+    Built once per process: the client owns its HTTP connection pool and is
+    safe to share across request threads.
+    """
     settings = get_settings()
     
     # Try Gemini first
@@ -212,6 +221,131 @@ def _get_llm():
     raise AgentServiceError("No LLM provider configured (need GEMINI_API_KEY or GROQ_API_KEY)")
 
 
+# Shared across requests: the tools are blocking HTTP/geodesic calls, so a
+# thread pool lets one validation overlap them instead of summing them.
+_TOOL_POOL = ThreadPoolExecutor(
+    max_workers=get_settings().tool_pool_size, thread_name_prefix="route-tools"
+)
+
+ToolOutcome = tuple[str, AgentToolCall | None, str]
+
+
+def _geocode_targets(targets: list[tuple[str, float, float]]) -> list[tuple[str, dict | None]]:
+    """Reverse-geocode ``targets`` one after another on a single pool worker."""
+    return [(key, reverse_geocode_mapbox(lat, lon)) for key, lat, lon in targets]
+
+
+def _preview(output: str) -> str:
+    return output[:200] + "..." if len(output) > 200 else output
+
+
+def _run_weather_tool(route_request: RouteRequest) -> ToolOutcome:
+    """Tool 1: Check weather for start location."""
+    from app.services.agent_tools import check_weather_conditions
+    try:
+        weather_result = check_weather_conditions.invoke({"location": route_request.start_location})
+        print(f"[TOOL] Weather result: {weather_result[:500]}")
+        return "weather", AgentToolCall(
+            tool="check_weather_conditions",
+            arguments={"location": route_request.start_location},
+            output=weather_result,
+            output_preview=_preview(weather_result),
+        ), weather_result
+    except Exception as e:
+        print(f"[TOOL ERROR] Weather failed: {e}")
+        return "weather", None, f"Weather unavailable: {e}"
+
+
+def _run_metrics_tool(route_request: RouteRequest) -> ToolOutcome:
+    """Tool 2: Calculate route metrics."""
+    from app.services.agent_tools import calculate_route_metrics
+    try:
+        route_data = {
+            "start_location": route_request.start_location,
+            "start_latitude": getattr(route_request, "start_latitude", None),
+            "start_longitude": getattr(route_request, "start_longitude", None),
+            "stops": [
+                {
+                    "location": stop.location,
+                    "latitude": getattr(stop, "latitude", None),
+                    "longitude": getattr(stop, "longitude", None),
+                }
+                for stop in route_request.stops
+            ],
+            "area_type": "urban",
+            "vehicle_type": route_request.vehicle_type or "van"
+        }
+        print(f"[TOOL] Calling calculate_route_metrics with: {route_data}")
+        metrics_result = calculate_route_metrics.invoke({"route_data": route_data})
+        print(f"[TOOL] Metrics result: {metrics_result[:500]}")
+        return "metrics", AgentToolCall(
+            tool="calculate_route_metrics",
+            arguments=route_data,
+            output=metrics_result,  # Full output
+            output_preview=_preview(metrics_result),
+        ), metrics_result
+    except Exception as e:
+        print(f"[TOOL ERROR] Metrics failed: {e}")
+        return "metrics", None, f"Calculation error: {e}"
+
+
+def _run_timing_tool(route_request: RouteRequest) -> ToolOutcome:
+    """Tool 3: Validate route timing (if task includes validation)."""
+    from app.services.agent_tools import validate_route_timing
+    try:
+        route_data_for_validation = route_request.model_dump()
+        print(f"[TOOL] Calling validate_route_timing with: {json.dumps(route_data_for_validation, indent=2)}")
+        timing_result = validate_route_timing.invoke({"route_request": route_data_for_validation})
+        print(f"[TOOL] Timing validation result: {timing_result[:500]}")
+        return "timing_validation", AgentToolCall(
+            tool="validate_route_timing",
+            arguments={"route_id": route_request.route_id},
+            output=timing_result,
+            output_preview=_preview(timing_result),
+        ), timing_result
+    except Exception as e:
+        print(f"[TOOL ERROR] Timing validation failed: {e}")
+        return "timing_validation", None, f"Validation error: {e}"
+
+
+def _run_optimization_tool(route_request: RouteRequest) -> ToolOutcome:
+    """Tool 4: Optimize stop sequence (if task includes optimization)."""
+    from app.services.agent_tools import optimize_stop_sequence
+    try:
+        route_data_for_optimization = route_request.model_dump()
+        optimization_result = optimize_stop_sequence.invoke({"route_request": route_data_for_optimization})
+        return "optimization", AgentToolCall(
+            tool="optimize_stop_sequence",
+            arguments={"route_id": route_request.route_id},
+            output=optimization_result,
+            output_preview=_preview(optimization_result),
+        ), optimization_result
+    except Exception as e:
+        return "optimization", None, f"Optimization error: {e}"
+
+
+def _run_traffic_tool(route_request: RouteRequest) -> ToolOutcome:
+    """Tool 5: Check traffic conditions at the start location."""
+    from app.services.agent_tools import check_traffic_conditions
+    try:
+        # Parse planned_start_time to get time of day
+        start_dt = datetime.fromisoformat(route_request.planned_start_time.replace('Z', '+00:00'))
+        time_of_day = start_dt.strftime("%H:%M")
+
+        traffic_result = check_traffic_conditions.invoke({
+            "location": route_request.start_location,
+            "time_of_day": time_of_day
+        })
+        return "traffic", AgentToolCall(
+            tool="check_traffic_conditions",
+            arguments={"location": route_request.start_location, "time_of_day": time_of_day},
+            output=traffic_result,
+            output_preview=_preview(traffic_result),
+        ), traffic_result
+    except Exception as e:
+        return "traffic", None, f"Traffic check unavailable: {e}"
+
+
 def run_route_validation_agent(
     route_request: RouteRequest,
     db: Session | None = None,
@@ -228,187 +362,66 @@ def run_route_validation_agent(
     # Get LLM
     llm = _get_llm()
     
-    # Resolve coordinates to city names for display
-    from app.services.agent_tools import reverse_geocode_mapbox
-    resolved_locations: dict[str, str] = {}
-    
-    # Resolve start location if it has coordinates
-    if hasattr(route_request, 'start_latitude') and hasattr(route_request, 'start_longitude'):
-        if route_request.start_latitude and route_request.start_longitude:
-            geo_result = reverse_geocode_mapbox(route_request.start_latitude, route_request.start_longitude)
-            if geo_result:
-                resolved_locations["start"] = geo_result.get("formatted", geo_result.get("city", ""))
-    
-    # Resolve stop locations if they have coordinates
-    for stop in route_request.stops:
-        if hasattr(stop, 'latitude') and hasattr(stop, 'longitude'):
-            if stop.latitude and stop.longitude:
-                geo_result = reverse_geocode_mapbox(stop.latitude, stop.longitude)
-                if geo_result:
-                    resolved_locations[stop.stop_id] = geo_result.get("formatted", geo_result.get("city", ""))
-    
+    # Reverse geocoding, the tool calls and the RAG query are independent
+    # round-trips, so the network-bound ones run on the shared pool while the
+    # knowledge-base search (which needs the request session) runs here. The
+    # tool jobs go first so they never queue behind this route's geocoding.
+
     # Get all available real tools
     tools = get_all_tools()
-    
+
+    tool_jobs = [_run_weather_tool]
+    if len(route_request.stops) > 0:
+        tool_jobs.append(_run_metrics_tool)
+    if route_request.task in ["validate_route", "validate_and_recommend"]:
+        tool_jobs.append(_run_timing_tool)
+    if route_request.task in ["optimize_route", "validate_and_recommend"]:
+        tool_jobs.append(_run_optimization_tool)
+    tool_jobs.append(_run_traffic_tool)
+    tool_futures = [_TOOL_POOL.submit(job, route_request) for job in tool_jobs]
+
+    geocode_targets: list[tuple[str, float, float]] = []
+    if getattr(route_request, "start_latitude", None) and getattr(route_request, "start_longitude", None):
+        geocode_targets.append(("start", route_request.start_latitude, route_request.start_longitude))
+    for stop in route_request.stops:
+        if getattr(stop, "latitude", None) and getattr(stop, "longitude", None):
+            geocode_targets.append((stop.stop_id, stop.latitude, stop.longitude))
+    # Bound this request's share of the pool: stops are dealt round-robin
+    # across at most ``geocode_fanout`` jobs, each geocoding its slice serially.
+    fanout = max(1, min(get_settings().geocode_fanout, len(geocode_targets)))
+    geocode_futures = (
+        [_TOOL_POOL.submit(_geocode_targets, geocode_targets[offset::fanout]) for offset in range(fanout)]
+        if geocode_targets
+        else []
+    )
+
     # Create RAG context
     rag_contexts: list[RetrievedContext] = []
     if db is not None:
         retriever = build_retriever(db)
         search_query = f"route planning delivery logistics {route_request.task}"
         rag_contexts = retriever.search(search_query, k=3)
-    
+        # Release the connection while the tools and LLM run; persisting the
+        # run below checks out a fresh one.
+        db.commit()
+
+    resolved_locations: dict[str, str] = {}
+    for future in geocode_futures:
+        for key, geo_result in future.result():
+            if geo_result:
+                resolved_locations[key] = geo_result.get("formatted", geo_result.get("city", ""))
+
     # Execute real tools based on task
     try:
         tool_calls = []
         tool_results = {}
-        
-        # Tool 1: Check weather for start location
-        from app.services.agent_tools import check_weather_conditions
-        try:
-            weather_result = check_weather_conditions.invoke({"location": route_request.start_location})
-            tool_calls.append(
-                AgentToolCall(
-                    tool="check_weather_conditions",
-                    arguments={"location": route_request.start_location},
-                    output=weather_result,
-                    output_preview=weather_result[:200] + "..." if len(weather_result) > 200 else weather_result,
-                )
-            )
-            tool_results['weather'] = weather_result
-            print(f"[TOOL] Weather result: {weather_result[:500]}")
-        except Exception as e:
-            tool_results['weather'] = f"Weather unavailable: {e}"
-            print(f"[TOOL ERROR] Weather failed: {e}")
-        
-        # Tool 2: Calculate route metrics
-        if len(route_request.stops) > 0:
-            from app.services.agent_tools import calculate_route_metrics
-            try:
-                # Calculate actual distance using geopy
-                from geopy.distance import geodesic
-                import re
-                
-                def extract_coords(location_str):
-                    """Extract coordinates from location string or return approximate coords."""
-                    # Try to extract lat/lng if present in the string
-                    match = re.search(r'(-?\d+\.\d+),\s*(-?\d+\.\d+)', location_str)
-                    if match:
-                        return (float(match.group(1)), float(match.group(2)))
-                    # For demo: return None and use default estimate
-                    return None
-                
-                total_distance_km = 0
-                start_coords = extract_coords(route_request.start_location)
-                
-                # Calculate cumulative distance between consecutive stops
-                prev_location = route_request.start_location
-                for stop in route_request.stops:
-                    # Use geodesic if coordinates available, otherwise estimate
-                    curr_coords = extract_coords(stop.location)
-                    if start_coords and curr_coords:
-                        # Use actual distance calculation
-                        distance = geodesic(start_coords, curr_coords).kilometers
-                        total_distance_km += distance
-                        start_coords = curr_coords
-                    else:
-                        # Fallback: estimate based on urban delivery patterns (5-20km per stop)
-                        import random
-                        random.seed(hash(stop.location))  # Consistent per location
-                        total_distance_km += random.uniform(8, 18)
-                
-                route_data = {
-                    "start_location": route_request.start_location,
-                    "start_latitude": getattr(route_request, "start_latitude", None),
-                    "start_longitude": getattr(route_request, "start_longitude", None),
-                    "stops": [
-                        {
-                            "location": stop.location,
-                            "latitude": getattr(stop, "latitude", None),
-                            "longitude": getattr(stop, "longitude", None),
-                        }
-                        for stop in route_request.stops
-                    ],
-                    "area_type": "urban",
-                    "vehicle_type": route_request.vehicle_type or "van"
-                }
-                print(f"[TOOL] Calling calculate_route_metrics with: {route_data}")
-                metrics_result = calculate_route_metrics.invoke({"route_data": route_data})
-                tool_calls.append(
-                    AgentToolCall(
-                        tool="calculate_route_metrics",
-                        arguments=route_data,
-                        output=metrics_result,  # Full output
-                        output_preview=metrics_result[:200] + "..." if len(metrics_result) > 200 else metrics_result,
-                    )
-                )
-                tool_results['metrics'] = metrics_result
-                print(f"[TOOL] Metrics result: {metrics_result[:500]}")
-            except Exception as e:
-                tool_results['metrics'] = f"Calculation error: {e}"
-                print(f"[TOOL ERROR] Metrics failed: {e}")
-        
-        # Tool 3: Validate route timing (if task includes validation)
-        if route_request.task in ["validate_route", "validate_and_recommend"]:
-            from app.services.agent_tools import validate_route_timing
-            try:
-                route_data_for_validation = route_request.model_dump()
-                print(f"[TOOL] Calling validate_route_timing with: {json.dumps(route_data_for_validation, indent=2)}")
-                timing_result = validate_route_timing.invoke({"route_request": route_data_for_validation})
-                tool_calls.append(
-                    AgentToolCall(
-                        tool="validate_route_timing",
-                        arguments={"route_id": route_request.route_id},
-                        output=timing_result,
-                        output_preview=timing_result[:200] + "..." if len(timing_result) > 200 else timing_result,
-                    )
-                )
-                tool_results['timing_validation'] = timing_result
-                print(f"[TOOL] Timing validation result: {timing_result[:500]}")
-            except Exception as e:
-                tool_results['timing_validation'] = f"Validation error: {e}"
-                print(f"[TOOL ERROR] Timing validation failed: {e}")
-        
-        # Tool 4: Optimize stop sequence (if task includes optimization)
-        if route_request.task in ["optimize_route", "validate_and_recommend"]:
-            from app.services.agent_tools import optimize_stop_sequence
-            try:
-                route_data_for_optimization = route_request.model_dump()
-                optimization_result = optimize_stop_sequence.invoke({"route_request": route_data_for_optimization})
-                tool_calls.append(
-                    AgentToolCall(
-                        tool="optimize_stop_sequence",
-                        arguments={"route_id": route_request.route_id},
-                        output=optimization_result,
-                        output_preview=optimization_result[:200] + "..." if len(optimization_result) > 200 else optimization_result,
-                    )
-                )
-                tool_results['optimization'] = optimization_result
-            except Exception as e:
-                tool_results['optimization'] = f"Optimization error: {e}"
-        
-        # Tool 5: Check traffic conditions for each stop location
-        from app.services.agent_tools import check_traffic_conditions
-        from datetime import datetime
-        try:
-            # Parse planned_start_time to get time of day
-            start_dt = datetime.fromisoformat(route_request.planned_start_time.replace('Z', '+00:00'))
-            time_of_day = start_dt.strftime("%H:%M")
-            
-            traffic_result = check_traffic_conditions.invoke({
-                "location": route_request.start_location,
-                "time_of_day": time_of_day
-            })
-            tool_calls.append(
-                AgentToolCall(
-                    tool="check_traffic_conditions",
-                    arguments={"location": route_request.start_location, "time_of_day": time_of_day},
-                    output=traffic_result,
-                    output_preview=traffic_result[:200] + "..." if len(traffic_result) > 200 else traffic_result,
-                )
-            )
-            tool_results['traffic'] = traffic_result
-        except Exception as e:
-            tool_results['traffic'] = f"Traffic check unavailable: {e}"
+
+        # Collect in submission order so the prompt and trace stay deterministic.
+        for future in tool_futures:
+            key, tool_call, result = future.result()
+            if tool_call is not None:
+                tool_calls.append(tool_call)
+            tool_results[key] = result
         
         # Add RAG context if available
         if rag_contexts:
@@ -644,11 +657,23 @@ def _parse_validation_result(agent_output: str, route_request: RouteRequest, too
     )
 
 
-def get_agent_history(db: Session, route_slug: str | None = None, limit: int = 10) -> list[AgentRun]:
-    """Retrieve historical agent runs from the database."""
+def get_agent_history(db: Session, route_slug: str | None = None, limit: int = 10) -> list[Row]:
+    """Retrieve historical agent run summaries from the database.
+
+    Only the columns the history view renders are selected, so the large
+    JSONB traces never leave Postgres.
+    """
     from sqlalchemy import select
 
-    query = select(AgentRun).order_by(AgentRun.created_at.desc()).limit(limit)
+    query = select(
+        AgentRun.id,
+        AgentRun.route_slug,
+        AgentRun.audience_role,
+        AgentRun.summary,
+        AgentRun.gemini_insight,
+        AgentRun.used_gemini,
+        AgentRun.created_at,
+    ).order_by(AgentRun.created_at.desc()).limit(limit)
     if route_slug:
         query = query.where(AgentRun.route_slug == route_slug)
-    return list(db.execute(query).scalars().all())
+    return list(db.execute(query).all())
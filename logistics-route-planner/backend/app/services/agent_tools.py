@@ -16,10 +16,12 @@ from datetime import datetime, timedelta
 
 from langchain_core.tools import tool
 import requests
+from requests.adapters import HTTPAdapter
 from geopy.geocoders import Nominatim
 from geopy.distance import geodesic
 
 from app.config import get_settings
+from app.services.llm_cache import LLMCache
 
 # Try to import googlemaps, make it optional
 try:
@@ -29,6 +31,19 @@ except ImportError:
     GOOGLE_MAPS_AVAILABLE = False
 
 
+# One pooled session for every tool: route validation fans calls out across
+# threads, and keep-alive skips a TCP/TLS handshake on each MapBox/weather call.
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Depots and stops repeat constantly, so reverse geocoding results are cached on
+# coordinates rounded to 4 decimals (~11 m).
+_settings = get_settings()
+_geocode_cache: LLMCache[dict[str, Any]] = LLMCache(
+    maxsize=_settings.geocode_cache_size, ttl_seconds=_settings.geocode_cache_ttl
+)
+
+
 def _get_mapbox_client():
     """Lazily get MapBox client configuration."""
     settings = get_settings()
@@ -65,6 +80,18 @@ def reverse_geocode_mapbox(latitude: float, longitude: float) -> dict[str, Any]
             "formatted": "San Francisco, CA"
         }
     """
+    cache_key = f"{round(latitude, 4)},{round(longitude, 4)}"
+    place = _geocode_cache.get(cache_key)
+    if place is None:
+        place = _lookup_place_mapbox(latitude, longitude)
+        if place is None:
+            return None
+        _geocode_cache.set(cache_key, place)
+    return {**place, "coordinates": {"latitude": latitude, "longitude": longitude}}
+
+
+def _lookup_place_mapbox(latitude: float, longitude: float) -> dict[str, Any] | None:
+    """Call the MapBox reverse geocoding API; see ``reverse_geocode_mapbox``."""
     mapbox_client = _get_mapbox_client()
     if not mapbox_client:
         return None
@@ -76,7 +103,7 @@ def reverse_geocode_mapbox(latitude: float, longitude: float) -> dict[str, Any]
             "types": "place,locality,region,country"
         }
         
-        response = requests.get(url, params=params, timeout=5)
+        response = _http.get(url, params=params, timeout=5)
         response.raise_for_status()
         data = response.json()
         
@@ -121,7 +148,6 @@ def reverse_geocode_mapbox(latitude: float, longitude: float) -> dict[str, Any]
                 "region": region,
                 "country": country,
                 "formatted": formatted,
-                "coordinates": {"latitude": latitude, "longitude": longitude}
             }
         
         return None
@@ -204,7 +230,7 @@ def check_weather_conditions(location: str) -> str:
         last_exception: Exception | None = None
         for timeout in (5, 10):
             try:
-                response = requests.get(url, params=params, timeout=timeout)
+                response = _http.get(url, params=params, timeout=timeout)
                 response.raise_for_status()
                 break
             except requests.exceptions.Timeout as exc:
@@ -375,7 +401,7 @@ def calculate_route_metrics(route_data: dict[str, Any]) -> str:
                     "steps": "false"
                 }
 
-                response = requests.get(url, params=params, timeout=10)
+                response = _http.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
 
@@ -709,7 +735,7 @@ def check_traffic_conditions(location: str, time_of_day: str = "now") -> str:
                         "overview": "false"
                     }
                     
-                    response = requests.get(url, params=params, timeout=10)
+                    response = _http.get(url, params=params, timeout=10)
                     response.raise_for_status()
                     data = response.json()
                     
@@ -719,7 +745,7 @@ def check_traffic_conditions(location: str, time_of_day: str = "now") -> str:
                         
                         # Get route without traffic (free-flow)
                         url_no_traffic = f"{mapbox_client['base_url']}/directions/v5/mapbox/driving/{start_coords};{end_coords}"
-                        response_no_traffic = requests.get(url_no_traffic, params=params, timeout=10)
+                        response_no_traffic = _http.get(url_no_traffic, params=params, timeout=10)
                         data_no_traffic = response_no_traffic.json()
                         
                         if data_no_traffic.get("routes"):
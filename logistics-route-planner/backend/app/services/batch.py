@@ -0,0 +1,49 @@
+"""Fan a request-scoped service call out over a batch of inputs.
+
+Each item gets its own database session because a ``Session`` must not be
+shared across threads; the pool bound keeps a large batch from exhausting
+the connection pool or the LLM provider's rate limit.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, Sequence, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BatchOutcome(Generic[R]):
+    """Result of one batch item; exactly one of ``value`` and ``error`` is set."""
+
+    value: R | None = None
+    error: str | None = None
+
+
+def run_batch(func: Callable[[T, Session], R], items: Sequence[T], max_workers: int) -> list[BatchOutcome[R]]:
+    """Run ``func(item, db)`` for every item concurrently, preserving input order.
+
+    A failing item is reported in its own outcome instead of failing the batch.
+    """
+
+    def _one(item: T) -> BatchOutcome[R]:
+        db = SessionLocal()
+        try:
+            return BatchOutcome(value=func(item, db))
+        except Exception as exc:  # noqa: BLE001 - surfaced per item to the caller
+            db.rollback()
+            return BatchOutcome(error=str(exc))
+        finally:
+            db.close()
+
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        return list(pool.map(_one, items))
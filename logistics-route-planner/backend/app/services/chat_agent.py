@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.prompts import ChatPromptTemplate
@@ -12,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.services.agent_tools import get_all_tools
+from app.services.llm_cache import LLMCache, llm_cache
 from app.services.rag import build_retriever
 
 try:
@@ -46,8 +48,12 @@ class ChatResponse(BaseModel):
     rag_contexts: list[RAGContext] = []
 
 
+@lru_cache(maxsize=1)
 def _get_llm():
-    """Get configured LLM (Gemini or Groq) with tool calling disabled for chat agent."""
+    """Get configured LLM (Gemini or Groq) with tool calling disabled for chat agent.
+
+    Built once per process so requests reuse the client's connection pool.
+    """
     settings = get_settings()
     
     # Try Gemini first
@@ -71,11 +77,50 @@ def _get_llm():
     raise RuntimeError("No LLM provider configured (need GEMINI_API_KEY or GROQ_API_KEY)")
 
 
+# The prompt is static, so it is parsed once rather than on every request.
+_CHAT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert logistics route planning assistant.
+
+Answer the user's question based on the information provided below.
+
+FORMATTING GUIDELINES:
+- Use clear headings (## for main sections, ### for subsections)
+- Use bullet points • for lists
+- Use numbered lists for steps or sequential items
+- Keep paragraphs short (2-3 sentences max)
+- Use **bold** for key terms
+- Add blank lines between sections for readability
+- When listing strategies, use a clear format with name, description, and key points
+
+IMPORTANT: Do not call any tools or functions. Simply answer based on the information provided.
+The information below has already been retrieved for you - use it directly in your answer.
+
+Retrieved Information:
+{tool_context}"""),
+    ("human", "{question}")
+])
+
+
+# Cached answers are namespaced by the tool manifest, so adding or renaming a
+# tool never serves an answer produced without it.
+_CACHE_NAMESPACE = "chat:" + ",".join(tool.name for tool in get_all_tools())
+
+
+@lru_cache(maxsize=1)
+def _get_chain():
+    """Compose the chat prompt with the cached LLM once per process."""
+    return _CHAT_PROMPT | _get_llm()
+
+
 def run_chat_agent(question: str, db: Session) -> ChatResponse:
     """Run chat agent with automatic tool selection based on question keywords."""
     
-    # Get LLM
-    llm = _get_llm()
+    # Get the prompt | LLM chain (raises early when no provider is configured)
+    chain = _get_chain()
+
+    cache_key = LLMCache.key(_CACHE_NAMESPACE, question)
+    if (cached := llm_cache.get(cache_key)) is not None:
+        return cached
     
     # Get available tools
     tools = get_all_tools()
@@ -91,6 +136,8 @@ def run_chat_agent(question: str, db: Session) -> ChatResponse:
             RAGContext(content=doc.content, source=doc.source, score=doc.score)
             for doc in rag_docs
         ]
+        # Hand the connection back to the pool before the slow tool and LLM calls.
+        db.commit()
     
     # Smart tool selection based on question keywords
     question_lower = question.lower()
@@ -296,32 +343,8 @@ def run_chat_agent(question: str, db: Session) -> ChatResponse:
         rag_text = "\n".join([f"• ({ctx.source}) {ctx.content[:200]}..." for ctx in rag_contexts])
         tool_context += f"\n\n## Knowledge Base\n\n{rag_text}"
     
-    # Create prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are an expert logistics route planning assistant.
-
-Answer the user's question based on the information provided below.
-
-FORMATTING GUIDELINES:
-- Use clear headings (## for main sections, ### for subsections)
-- Use bullet points • for lists
-- Use numbered lists for steps or sequential items
-- Keep paragraphs short (2-3 sentences max)
-- Use **bold** for key terms
-- Add blank lines between sections for readability
-- When listing strategies, use a clear format with name, description, and key points
-
-IMPORTANT: Do not call any tools or functions. Simply answer based on the information provided.
-The information below has already been retrieved for you - use it directly in your answer.
-
-Retrieved Information:
-{tool_context}"""),
-        ("human", "{question}")
-    ])
-    
     # Invoke LLM
     try:
-        chain = prompt | llm
         response = chain.invoke({
             "tool_context": tool_context if tool_context else "No tools were needed for this question.",
             "question": question,
@@ -333,11 +356,12 @@ Retrieved Information:
         else:
             answer = str(response)
         
-        return ChatResponse(
+        # Only successful answers are cached; the fallback below is retried.
+        return llm_cache.set(cache_key, ChatResponse(
             answer=answer,
             tool_calls=tool_calls,
             rag_contexts=rag_contexts,
-        )
+        ))
     
     except Exception as e:
         # Fallback response
@@ -0,0 +1,70 @@
+"""In-process cache for LLM responses keyed on the exact model and prompt.
+
+Demos and repeated UI actions send byte-identical prompts to ``/gemini/generate``
+and identical questions to ``/ai/chat``. Reusing the earlier answer skips both
+the network round-trip and the token bill for those repeats.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+from app.config import get_settings
+
+V = TypeVar("V")
+
+
+class LLMCache(Generic[V]):
+    """Thread-safe LRU cache with a per-entry time-to-live."""
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        """Return a content-addressed key for ``prompt`` sent to ``model``."""
+
+        return hashlib.blake2b(f"{model}\x00{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> V | None:
+        """Return the cached response for ``key`` if present and not expired."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: V) -> V:
+        """Store ``value`` under ``key`` and return it for call-site chaining."""
+
+        if self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+_settings = get_settings()
+llm_cache: LLMCache = LLMCache(maxsize=_settings.llm_cache_size, ttl_seconds=_settings.llm_cache_ttl)
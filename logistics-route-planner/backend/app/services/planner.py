@@ -6,6 +6,8 @@ import os
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import Text, cast, literal
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -349,9 +351,11 @@ def save_route_run(db: Session, request: RouteRequest, plan: RoutePlan) -> Route
         primary_risk=request.primary_risk,
         include_risks=bool(request.primary_risk),
         summary=summary,
-        plan=plan.model_dump(mode="json"),
+        # Hand Postgres the JSON text pydantic already produced and cast it
+        # server-side, rather than dumping to a dict for psycopg2 to re-encode.
+        # Binding as Text matters: a JSONB-typed bind would encode it again.
+        plan=cast(literal(plan.model_dump_json(), Text), JSONB),
     )
     db.add(run)
     db.commit()
-    db.refresh(run)
     return run
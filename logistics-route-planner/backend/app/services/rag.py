@@ -1,22 +1,20 @@
-"""Simple retrieval helper backed by FAISS and SentenceTransformers embeddings."""
+"""Simple retrieval helper backed by pgvector and SentenceTransformers embeddings."""
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Sequence
 
-import faiss  # type: ignore
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
-from app.models import DocumentChunk
+from app.models import EMBEDDING_HALF, DocumentChunk
 
 # Use a lightweight but effective model for embeddings
 EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
-EMBED_DIM = 384  # Dimension for all-MiniLM-L6-v2 model
 
 
 @lru_cache(maxsize=1)
@@ -40,58 +38,65 @@ class RetrievedContext:
 
 
 class Retriever:
-    """Tiny wrapper around a FAISS index for context retrieval."""
+    """Rank stored chunks inside Postgres using the half-precision pgvector HNSW index.
 
-    def __init__(self, chunks: Sequence[DocumentChunk]):
-        self.chunks = list(chunks)
-        if not self.chunks:
-            self.index = None
-            return
+    Only the ``k`` nearest rows travel back over the wire, so nothing is
+    decoded or scanned in Python and no per-request FAISS index is built.
+    """
 
-        self.index = faiss.IndexFlatL2(EMBED_DIM)
-        embeddings = np.stack([np.array(chunk.embedding, dtype="float32") for chunk in self.chunks])
-        self.index.add(embeddings)
+    def __init__(self, db: Session):
+        self.db = db
 
     def search(self, query: str, k: int = 3) -> list[RetrievedContext]:
-        if not self.index or not self.chunks:
-            return []
-
-        query_vector = np.expand_dims(embed_text(query), axis=0)
-        distances, indices = self.index.search(query_vector, min(k, len(self.chunks)))
-        results: list[RetrievedContext] = []
-        for score, idx in zip(distances[0], indices[0]):
-            if idx == -1:
-                continue
-            chunk = self.chunks[idx]
-            results.append(
-                RetrievedContext(content=chunk.content, source=chunk.source, score=float(score))
-            )
-        return results
-
-
-def ensure_embeddings(db: Session) -> list[DocumentChunk]:
-    """Compute embeddings for stored chunks when they are missing."""
-    chunks = db.execute(select(DocumentChunk)).scalars().all()
-    updated = False
-    for chunk in chunks:
-        if not chunk.embedding:
-            vector = embed_text(chunk.content)
-            chunk.embedding = vector.tolist()
-            db.add(chunk)
-            updated = True
-    if updated:
+        return self.search_vector(embed_text(query), k)
+
+    def search_vector(
+        self, query_vector: np.ndarray, k: int = 3, ef_search: int | None = None
+    ) -> list[RetrievedContext]:
+        """Rank chunks against an already computed query embedding.
+
+        ``ef_search`` widens the HNSW candidate list for this transaction only
+        (pgvector defaults to 40); leave it unset for the server default.
+        """
+        if ef_search is not None:
+            self.db.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+        distance = EMBEDDING_HALF.cosine_distance(query_vector)
+        rows = self.db.execute(
+            select(DocumentChunk.content, DocumentChunk.source, distance.label("score"))
+            .where(DocumentChunk.embedding.is_not(None))
+            .order_by(distance)
+            .limit(k)
+        ).all()
+        return [RetrievedContext(content=row.content, source=row.source, score=float(row.score)) for row in rows]
+
+
+def ensure_embeddings(db: Session) -> int:
+    """Compute embeddings for stored chunks that do not have one yet."""
+    missing = db.execute(
+        select(DocumentChunk.id, DocumentChunk.content).where(DocumentChunk.embedding.is_(None))
+    ).all()
+    if missing:
+        db.execute(
+            update(DocumentChunk),
+            [{"id": row.id, "embedding": embed_text(row.content)} for row in missing],
+        )
         db.commit()
-    return chunks
+    return len(missing)
 
 
-@lru_cache(maxsize=1)
-def _empty_retriever() -> Retriever:
-    return Retriever([])
+# The backfill only needs to run once per process: ingestion stores embeddings
+# itself, so later requests skip the NULL-embedding scan entirely.
+_embeddings_ready = False
+_embeddings_lock = threading.Lock()
 
 
 def build_retriever(db: Session) -> Retriever:
-    """Load chunks from the database and construct a FAISS-backed retriever."""
-    chunks = ensure_embeddings(db)
-    if not chunks:
-        return _empty_retriever()
-    return Retriever(chunks)
+    """Return a pgvector-backed retriever, embedding pending chunks on first use."""
+    global _embeddings_ready
+    if not _embeddings_ready:
+        with _embeddings_lock:
+            if not _embeddings_ready:
+                ensure_embeddings(db)
+                _embeddings_ready = True
+    return Retriever(db)
+
@@ -0,0 +1,82 @@
+"""In-process semantic cache for knowledge-base searches.
+
+Near-duplicate questions ("How do I handle time windows?" / "how to handle
+time windows") embed to almost the same vector, so a cosine match against
+recently answered queries can return their results without a database scan.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+import numpy as np
+
+from app.config import get_settings
+
+V = TypeVar("V")
+
+
+class SemanticQueryCache(Generic[V]):
+    """Thread-safe LRU cache keyed by query embedding similarity, with a TTL."""
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 300.0, threshold: float = 0.95) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._entries: OrderedDict[int, tuple[float, int, np.ndarray, V]] = OrderedDict()
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype="float32")
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, vector: np.ndarray, k: int) -> V | None:
+        """Return results cached for the most similar query with the same ``k``, if close enough."""
+
+        query = self._normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[0] <= now]:
+                del self._entries[key]
+            candidates = [(key, entry) for key, entry in self._entries.items() if entry[1] == k]
+            if not candidates:
+                return None
+            similarities = np.stack([entry[2] for _, entry in candidates]) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            key, entry = candidates[best]
+            self._entries.move_to_end(key)
+            return entry[3]
+
+    def put(self, vector: np.ndarray, k: int, value: V) -> V:
+        """Store ``value`` for this query embedding and return it for call-site chaining."""
+
+        if self.maxsize <= 0:
+            return value
+        with self._lock:
+            self._entries[self._next_key] = (time.monotonic() + self.ttl_seconds, k, self._normalize(vector), value)
+            self._next_key += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached result, e.g. after new documents are ingested."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+_settings = get_settings()
+search_cache: SemanticQueryCache = SemanticQueryCache(
+    maxsize=_settings.semantic_cache_size,
+    ttl_seconds=_settings.semantic_cache_ttl,
+    threshold=_settings.semantic_cache_threshold,
+)
@@ -0,0 +1,70 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import batch
+from app.services.batch import run_batch
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.rolled_back = False
+        self.closed = False
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _install_sessions(monkeypatch) -> list[_FakeSession]:
+    sessions: list[_FakeSession] = []
+    lock = threading.Lock()
+
+    def _session_factory() -> _FakeSession:
+        session = _FakeSession()
+        with lock:
+            sessions.append(session)
+        return session
+
+    monkeypatch.setattr(batch, "SessionLocal", _session_factory)
+    return sessions
+
+
+def test_run_batch_preserves_input_order(monkeypatch):
+    _install_sessions(monkeypatch)
+
+    def _slow_square(item: int, db) -> int:
+        # Earlier items finish last, so completion order differs from input order.
+        time.sleep(0.01 * (5 - item))
+        return item * item
+
+    outcomes = run_batch(_slow_square, [1, 2, 3, 4], max_workers=4)
+
+    assert [outcome.value for outcome in outcomes] == [1, 4, 9, 16]
+    assert all(outcome.error is None for outcome in outcomes)
+
+
+def test_run_batch_reports_failures_per_item(monkeypatch):
+    sessions = _install_sessions(monkeypatch)
+
+    def _fail_on_two(item: int, db) -> int:
+        if item == 2:
+            raise ValueError("bad stop")
+        return item
+
+    outcomes = run_batch(_fail_on_two, [1, 2, 3], max_workers=2)
+
+    assert [(outcome.value, outcome.error) for outcome in outcomes] == [
+        (1, None),
+        (None, "bad stop"),
+        (3, None),
+    ]
+    assert sum(session.rolled_back for session in sessions) == 1
+    assert all(session.closed for session in sessions)
@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import agent_tools
+from app.services.llm_cache import LLMCache
+
+
+def test_cached_place_carries_the_callers_exact_coordinates(monkeypatch):
+    lookups: list[tuple[float, float]] = []
+
+    def _lookup(latitude: float, longitude: float) -> dict:
+        lookups.append((latitude, longitude))
+        return {
+            "place_name": "San Francisco, California, United States",
+            "city": "San Francisco",
+            "formatted": "San Francisco, CA",
+            "coordinates": {"latitude": latitude, "longitude": longitude},
+        }
+
+    monkeypatch.setattr(agent_tools, "_geocode_cache", LLMCache(maxsize=8, ttl_seconds=60))
+    monkeypatch.setattr(agent_tools, "_lookup_place_mapbox", _lookup)
+
+    first = agent_tools.reverse_geocode_mapbox(37.774912, -122.419412)
+    # Rounds to the same 4-decimal key, so this is served from the cache.
+    second = agent_tools.reverse_geocode_mapbox(37.774938, -122.419437)
+
+    assert lookups == [(37.774912, -122.419412)]
+    assert second["formatted"] == "San Francisco, CA"
+    assert first["coordinates"] == {"latitude": 37.774912, "longitude": -122.419412}
+    assert second["coordinates"] == {"latitude": 37.774938, "longitude": -122.419437}
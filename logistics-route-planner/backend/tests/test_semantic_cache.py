@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import semantic_cache
+from app.services.semantic_cache import SemanticQueryCache
+
+
+def test_lookup_returns_results_for_a_near_duplicate_query():
+    cache = SemanticQueryCache(maxsize=4, ttl_seconds=60, threshold=0.95)
+    cache.put(np.array([1.0, 0.0, 0.0]), 3, ["time windows"])
+
+    assert cache.lookup(np.array([0.99, 0.05, 0.0]), 3) == ["time windows"]
+
+
+def test_lookup_misses_below_the_similarity_threshold():
+    cache = SemanticQueryCache(maxsize=4, ttl_seconds=60, threshold=0.95)
+    cache.put(np.array([1.0, 0.0, 0.0]), 3, ["time windows"])
+
+    assert cache.lookup(np.array([0.6, 0.8, 0.0]), 3) is None
+
+
+def test_lookup_only_matches_entries_stored_with_the_same_k():
+    cache = SemanticQueryCache(maxsize=4, ttl_seconds=60, threshold=0.95)
+    cache.put(np.array([1.0, 0.0]), 3, ["three results"])
+
+    assert cache.lookup(np.array([1.0, 0.0]), 5) is None
+    assert cache.lookup(np.array([1.0, 0.0]), 3) == ["three results"]
+
+
+def test_lookup_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+    cache = SemanticQueryCache(maxsize=4, ttl_seconds=10, threshold=0.95)
+    cache.put(np.array([1.0, 0.0]), 3, ["time windows"])
+
+    now[0] += 11
+
+    assert cache.lookup(np.array([1.0, 0.0]), 3) is None